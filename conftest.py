@@ -0,0 +1 @@
+# Makes the `games` package importable when pytest is run from the repo root.
@@ -1,155 +1,90 @@
 import pygame
 import random
-import string
-from games.game_to_letter import popup
+from games.content import CONTENT
+from games.review import REVIEW
+from games.text import render_text
+from games.engine import Engine
+from games.rounds import RoundGame
+from games.textinput import letters
 
 # ─── CONFIG ─────────────────────────────────────────────────────────────
-K1_WORDS = ["WILD", "CHILD", "KIND", "MIND", "FIND", "SUN", "DOG", "LOG", "BED", "HAT"]
-
-SPELLING_WORDS = {
-    "MOST":   ("M__T", ["OS", "OA", "OU"]),
-    "BREAK":  ("BR__K", ["EA", "AI", "AY"]),
-    "EIGHT":  ("E__HT", ["IG", "EI", "AY"]),
-    "KNOW":   ("K__W", ["NO", "KN", "NW"]),
-    "LOUD":   ("L__D", ["OU", "OO", "UV"]),
-    "EARLY":  ("E__LY", ["AR", "ER", "UR"]),
-    "LAUGH":  ("L__GH", ["AU", "AR", "AF"]),
-    "SURE":   ("S__E", ["UR", "OR", "IR"]),
-    "THOUGH": ("TH__GH", ["OU", "OA", "OE"]),
-}
-
-BG_IMAGE        = "assets/images/default_screen.png"
+# word lists live in games/add_letters.json, compiled by games.content
 PROMPT_COLOR    = (0, 102, 204)
 TEXT_COLOR      = (0, 0, 0)
-CORRECT_COLOR   = (0, 200, 0)
-WRONG_COLOR     = (200, 0, 0)
-
-def run_add_letters(screen, font):
-    clock = pygame.time.Clock()
-    sw, sh = screen.get_size()
-    bg = pygame.image.load(BG_IMAGE)
-    bg = pygame.transform.scale(bg, (sw, sh))
-
-    # ─── Grade Selection ──────────────────────────────────────────────
-    grade = ""
-    while not grade:
-        for e in pygame.event.get():
-            if e.type == pygame.QUIT:
-                return
-            elif e.type == pygame.KEYDOWN:
-                if e.unicode == "1":
-                    grade = "K1"
-                elif e.unicode == "2":
-                    grade = "23"
+OPTION_SPACING  = 150          # px between option centres at the base size
+OPTION_BOX      = (80, 60)
 
-        screen.blit(bg, (0, 0))
-        line1 = font.render("Select Grade Level:", True, 'black')
-        line2 = font.render("Press 1 for K–1", True, 'black')
-        line3 = font.render("Press 2 for Grade 2–3", True, 'black')
-        screen.blit(line1, line1.get_rect(center=(sw//2, sh//2 - 80)))
-        screen.blit(line2, line2.get_rect(center=(sw//2, sh//2)))
-        screen.blit(line3, line2.get_rect(center=(sw // 2-100, sh // 2+100)))
-        pygame.display.flip()
-        clock.tick(30)
+class AddLettersScene(RoundGame):
+    name   = "add_letters"
+    levels = {"1": "K1", "2": "23"}
 
-    # ─── Word Setup ────────────────────────────────────────────────────
-    correct = 0
-    if grade == "K1":
-        rounds = K1_WORDS.copy()
-    else:
-        rounds = list(SPELLING_WORDS.items())
+    def make_rounds(self, grade):
+        return REVIEW.select(self.name, grade, CONTENT.items(self.name, grade))
 
-    random.shuffle(rounds)
-    total = len(rounds)
-
-    for r in rounds:
-        typed = ""
-        feedback = ""
-        answered = False
-        color = TEXT_COLOR
-
-        if grade == "K1":
-            word = r
+    def setup_round(self, r):
+        if self.level == "K1":
+            word = self.word = r.word
             idx = random.randrange(len(word))
-            missing = word[idx]
-            display = word[:idx] + "_" + word[idx+1:]
-            options = [missing] + random.sample([c for c in string.ascii_uppercase if c != missing], 2)
+            self.answer_part = word[idx]
+            self.display = word[:idx] + "_" + word[idx+1:]
+            self.options = [self.answer_part, *r.options[idx]]
         else:
-            actual_word, (display, phonemes) = r
-            correct_phoneme = phonemes[0]
-            options = phonemes.copy()
-
-        random.shuffle(options)
-
-        # ─── Game Loop ────────────────────────────────────────────────
-        while not answered:
-            for e in pygame.event.get():
-                if e.type == pygame.QUIT:
-                    return correct / total
-                elif e.type == pygame.KEYDOWN:
-                    if e.key == pygame.K_RETURN and typed:
-                        if typed in options:
-                            if (grade == "K1" and typed == missing) or (grade == "23" and typed == correct_phoneme):
-                                feedback = "Correct!"
-                                color = CORRECT_COLOR
-                                correct += 1
-                            else:
-                                feedback = f"Oops—'{typed}' is wrong"
-                                color = WRONG_COLOR
-                        else:
-                            feedback = f"'{typed}' is not a valid option"
-                            color = WRONG_COLOR
-                        answered = True
-                    elif e.key == pygame.K_BACKSPACE:
-                        typed = typed[:-1]
-                    elif e.unicode.isalpha():
-                        max_len = 1 if grade == "K1" else 2
-                        if len(typed) < max_len:
-                            typed += e.unicode.upper()
+            self.word        = r.word
+            self.display     = r.display
+            self.answer_part = r.answer
+            self.options     = [self.answer_part, *r.options]
+        random.shuffle(self.options)
+
+    def target(self):
+        return self.word, self.answer_part
+
+    def validator(self):
+        return letters(1 if self.level == "K1" else 2, upper=True)
+
+    def check(self, typed):
+        if not typed:
+            return None
+        if typed not in self.options:
+            return False, f"'{typed}' is not a valid option"
+        if typed == self.answer_part:
+            return True, "Correct!"
+        return False, f"Oops—'{typed}' is wrong"
+
+    def result_lines(self, accuracy):
+        total = len(self.rounds)
+        if accuracy >= 0.8:
+            return [f"Great job! {self.correct}/{total} correct.",
+                    "You passed!",
+                    "Press SPACE to return"]
+        return [f"You got {self.correct}/{total}.",
+                "Try again next time."]
+
+    def draw_round(self, canvas):
+        ui   = self.layout
+        font = ui.font(self.font)
+        line1 = render_text(font, "Fill in the missing part", PROMPT_COLOR)
+        line2 = render_text(font, "Then press ENTER:", PROMPT_COLOR)
+        canvas.blit("line1", line1, center=ui.at(0.5, 0.5, dy=-190))
+        canvas.blit("line2", line2, center=ui.at(0.5, 0.5, dy=-150))
+
+        word_surf = render_text(font, self.display, PROMPT_COLOR, style=self.style)
+        canvas.blit("word", word_surf, center=ui.at(0.5, 0.5, dy=-40))
+
+        # Options, OPTION_SPACING apart and centred
+        mid = (len(self.options) - 1) / 2
+        for i, opt in enumerate(self.options):
+            opt_surf = render_text(font, opt, TEXT_COLOR, style=self.style)
+            pos = ui.at(0.5, 0.5, dx=(i - mid)*OPTION_SPACING, dy=20)
+            canvas.blit(("option", i), opt_surf, center=pos)
+            box = pygame.Rect((0, 0), ui.size(*OPTION_BOX))
+            box.center = pos
+            canvas.rect(("box", i), PROMPT_COLOR, box, 2)
+
+        self.input.draw(canvas, "typed", font, TEXT_COLOR, self.style, center=ui.at(0.5, 0.5, dy=100))
+
+        if self.feedback:
+            fb_surf = self.feedback_text(font)
+            canvas.blit("feedback", fb_surf, center=ui.at(0.5, 0.5, dy=140))
 
-            screen.blit(bg, (0, 0))
-            line1 = font.render("Fill in the missing part", True, PROMPT_COLOR)
-            line2 = font.render("Then press ENTER:", True, PROMPT_COLOR)
-            screen.blit(line1, line1.get_rect(center=(sw // 2, sh // 2 - 190)))
-            screen.blit(line2, line2.get_rect(center=(sw // 2, sh // 2 - 150)))
-
-            word_surf = font.render(display, True, PROMPT_COLOR)
-            screen.blit(word_surf, word_surf.get_rect(center=(sw//2, sh//2 - 40)))
-
-            # Options
-            start_x = sw//2 - 150
-            for i, opt in enumerate(options):
-                opt_surf = font.render(opt, True, TEXT_COLOR)
-                pos = (start_x + i*150, sh//2 + 20)
-                screen.blit(opt_surf, opt_surf.get_rect(center=pos))
-                box = pygame.Rect(0, 0, 80, 60)
-                box.center = pos
-                pygame.draw.rect(screen, PROMPT_COLOR, box, 2)
-
-            typed_surf = font.render(typed, True, TEXT_COLOR)
-            screen.blit(typed_surf, typed_surf.get_rect(center=(sw//2, sh//2 + 100)))
-
-            if feedback:
-                fb_surf = font.render(feedback, True, color)
-                screen.blit(fb_surf, fb_surf.get_rect(center=(sw//2, sh//2 + 140)))
-
-            pygame.display.flip()
-            clock.tick(30)
-
-        pygame.time.delay(800)
-
-    # ─── Result Popup ────────────────────────────────────────────────
-    accuracy = correct / total
-    if accuracy >= 0.8:
-        popup(screen, font, [
-            f"Great job! {correct}/{total} correct.",
-            "You passed!",
-            "Press SPACE to return"
-        ])
-    else:
-        popup(screen, font, [
-            f"You got {correct}/{total}.",
-            "Try again next time."
-
-        ])
-    return accuracy
+def run_add_letters(screen, font):
+    return Engine(screen).run(AddLettersScene(font))
@@ -0,0 +1,208 @@
+"""Class report over the attempt log: python -m games.analytics [--out DIR]
+
+Loads every student's segments into one NumPy record array and computes all
+aggregates with vectorized group-bys (no per-attempt Python loops).
+"""
+import argparse
+import csv
+import html
+import os
+import numpy as np
+from games.attempts import (ATTEMPTS, GAME_NAMES, HEADER, LEVEL_NAMES, RECORD)
+
+# ─── CONFIG ─────────────────────────────────────────────────────────────
+REPORT_DIR  = "reports"
+PERCENTILES = (50, 90)
+TOP_CONFUSIONS = 25
+
+# mirrors attempts.RECORD ("<dfBBBx16s16s16s")
+DTYPE = np.dtype([
+    ("ts",       "<f8"),
+    ("rt_ms",    "<f4"),
+    ("game",     "u1"),
+    ("level",    "u1"),
+    ("correct",  "u1"),
+    ("pad",      "u1"),
+    ("word",     "S16"),
+    ("expected", "S16"),
+    ("response", "S16"),
+])
+assert DTYPE.itemsize == RECORD.size
+
+
+# ─── LOADING ────────────────────────────────────────────────────────────
+def load(log=ATTEMPTS):
+    # -> (records, student index per record, student names)
+    chunks, owners, students = [], [], log.students()
+    for sid, student in enumerate(students):
+        for path in log.segments(student):
+            rec = np.fromfile(path, dtype=DTYPE, offset=HEADER.size)
+            chunks.append(rec)
+            owners.append(np.full(len(rec), sid, dtype=np.int32))
+    if not chunks:
+        return np.zeros(0, DTYPE), np.zeros(0, np.int32), students
+    return np.concatenate(chunks), np.concatenate(owners), students
+
+
+# ─── GROUP-BY HELPERS ───────────────────────────────────────────────────
+def group(*keys):
+    # dense group id per row for the combination of key columns
+    combined = np.zeros(len(keys[0]), dtype=np.int64)
+    for k in keys:
+        _, inv = np.unique(k, return_inverse=True)
+        combined = combined * (inv.max() + 1 if len(inv) else 1) + inv
+    _, first, inv = np.unique(combined, return_index=True, return_inverse=True)
+    return inv, first
+
+def accuracy(inv, correct):
+    counts = np.bincount(inv)
+    right  = np.bincount(inv, weights=correct)
+    return counts, right / np.maximum(counts, 1)
+
+def percentiles(inv, values, qs=PERCENTILES):
+    # nearest-rank percentiles of `values` within each group, vectorized
+    order  = np.lexsort((values, inv))
+    counts = np.bincount(inv)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    ranked = values[order]
+    return {q: ranked[starts + np.floor((counts - 1) * q / 100).astype(np.int64)] for q in qs}
+
+def upper(col):
+    # S16 column -> (N, 16) uint8, ASCII upper-cased
+    b = np.ascontiguousarray(col).view(np.uint8).reshape(len(col), 16).copy()
+    lower = (b >= ord("a")) & (b <= ord("z"))
+    b[lower] -= 32
+    return b
+
+
+# ─── AGGREGATES ─────────────────────────────────────────────────────────
+def by_word(rec):
+    inv, first = group(rec["game"], rec["level"], np.char.lower(rec["word"]))
+    counts, acc = accuracy(inv, rec["correct"])
+    pct = percentiles(inv, rec["rt_ms"])
+    rows = np.argsort(acc, kind="stable")          # hardest first
+    return [{
+        "game":     GAME_NAMES.get(int(rec["game"][first[g]]), "?"),
+        "level":    LEVEL_NAMES.get(int(rec["level"][first[g]]), "?"),
+        "word":     rec["word"][first[g]].decode("utf-8", "replace").lower(),
+        "attempts": int(counts[g]),
+        "accuracy": round(float(acc[g]), 3),
+        **{f"rt_p{q}_ms": round(float(pct[q][g]), 1) for q in PERCENTILES},
+    } for g in rows]
+
+def by_game_level(rec):
+    inv, first = group(rec["game"], rec["level"])
+    counts, acc = accuracy(inv, rec["correct"])
+    pct = percentiles(inv, rec["rt_ms"])
+    return [{
+        "game":     GAME_NAMES.get(int(rec["game"][first[g]]), "?"),
+        "level":    LEVEL_NAMES.get(int(rec["level"][first[g]]), "?"),
+        "attempts": int(counts[g]),
+        "accuracy": round(float(acc[g]), 3),
+        **{f"rt_p{q}_ms": round(float(pct[q][g]), 1) for q in PERCENTILES},
+    } for g in range(len(first))]
+
+def by_expected(rec):
+    # error rate per letter / grapheme the student had to produce
+    sel = rec[np.isin(rec["game"], (1, 3))]           # treasure, add letters
+    if not len(sel):
+        return []
+    inv, first = group(sel["game"], np.char.upper(sel["expected"]))
+    counts, acc = accuracy(inv, sel["correct"])
+    rows = np.argsort(acc, kind="stable")
+    return [{
+        "game":       GAME_NAMES.get(int(sel["game"][first[g]]), "?"),
+        "grapheme":   sel["expected"][first[g]].decode("utf-8", "replace").upper(),
+        "attempts":   int(counts[g]),
+        "error_rate": round(1 - float(acc[g]), 3),
+    } for g in rows]
+
+def letter_confusion(rec):
+    # 26x26 counts of expected letter (row) typed as another letter (col),
+    # position by position over wrong typed answers of the right length
+    # (memory-match misses are a different word, not a misspelling)
+    wrong = rec[np.isin(rec["game"], (1, 2, 3)) & (rec["correct"] == 0)]
+    e, r  = upper(wrong["expected"]), upper(wrong["response"])
+    same_len = (e != 0).sum(1) == (r != 0).sum(1)
+    e, r  = e[same_len], r[same_len]
+    mask  = (e != r) & (e >= 65) & (e <= 90) & (r >= 65) & (r <= 90)
+    matrix = np.zeros((26, 26), dtype=np.int64)
+    np.add.at(matrix, (e[mask] - 65, r[mask] - 65), 1)
+    return matrix
+
+def grapheme_confusions(rec):
+    # most frequent (expected -> typed) swaps of multi-letter graphemes
+    wrong = rec[(rec["correct"] == 0) & (np.char.str_len(rec["expected"]) > 1)
+                & (rec["game"] == 3)]
+    if not len(wrong):
+        return []
+    inv, first = group(np.char.upper(wrong["expected"]), np.char.upper(wrong["response"]))
+    counts = np.bincount(inv)
+    top = np.argsort(-counts, kind="stable")[:TOP_CONFUSIONS]
+    return [{
+        "expected": wrong["expected"][first[g]].decode().upper(),
+        "typed":    wrong["response"][first[g]].decode().upper(),
+        "count":    int(counts[g]),
+    } for g in top]
+
+
+# ─── REPORT ─────────────────────────────────────────────────────────────
+def report(rec):
+    return {
+        "accuracy_by_game_level": by_game_level(rec),
+        "accuracy_by_word":       by_word(rec),
+        "errors_by_grapheme":     by_expected(rec),
+        "grapheme_confusions":    grapheme_confusions(rec),
+    }
+
+def write_csv(out, tables, matrix):
+    for name, rows in tables.items():
+        with open(os.path.join(out, f"{name}.csv"), "w", newline="") as f:
+            if rows:
+                w = csv.DictWriter(f, fieldnames=list(rows[0]))
+                w.writeheader()
+                w.writerows(rows)
+    letters = [chr(65 + i) for i in range(26)]
+    with open(os.path.join(out, "letter_confusion.csv"), "w", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(["expected\\typed"] + letters)
+        w.writerows([letters[i]] + matrix[i].tolist() for i in range(26))
+
+def write_html(out, tables, matrix, n_rows, n_students):
+    def table(rows):
+        if not rows:
+            return "<p>No data.</p>"
+        head = "".join(f"<th>{html.escape(k)}</th>" for k in rows[0])
+        body = "".join("<tr>" + "".join(f"<td>{html.escape(str(v))}</td>" for v in r.values()) + "</tr>"
+                       for r in rows)
+        return f"<table><tr>{head}</tr>{body}</table>"
+
+    letters = [chr(65 + i) for i in range(26)]
+    confusion = [{"": letters[i], **{l: int(matrix[i, j]) for j, l in enumerate(letters)}}
+                 for i in range(26) if matrix[i].any()]
+    parts = [f"<h1>Lucky Letters class report</h1><p>{n_rows} attempts from {n_students} students.</p>"]
+    for name, rows in tables.items():
+        parts.append(f"<h2>{name.replace('_', ' ').capitalize()}</h2>{table(rows)}")
+    parts.append(f"<h2>Letter confusion (expected row, typed column)</h2>{table(confusion)}")
+    style = "table{border-collapse:collapse}td,th{border:1px solid #aaa;padding:2px 6px}"
+    with open(os.path.join(out, "report.html"), "w") as f:
+        f.write(f"<!doctype html><meta charset='utf-8'><style>{style}</style>{''.join(parts)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--log", default=ATTEMPTS.root, help="attempt log directory")
+    parser.add_argument("--out", default=REPORT_DIR, help="where to write the report")
+    parser.add_argument("--format", choices=("csv", "html", "both"), default="both")
+    args = parser.parse_args()
+
+    ATTEMPTS.root = args.log
+    rec, owners, students = load()
+    os.makedirs(args.out, exist_ok=True)
+    tables = report(rec)
+    matrix = letter_confusion(rec)
+    if args.format in ("csv", "both"):
+        write_csv(args.out, tables, matrix)
+    if args.format in ("html", "both"):
+        write_html(args.out, tables, matrix, len(rec), len(students))
+    print(f"{len(rec)} attempts from {len(students)} students -> {args.out}")
@@ -0,0 +1,167 @@
+import json
+import os
+import threading
+import pygame
+from collections import OrderedDict
+from games.prefetch import PREFETCH
+
+# ─── CONFIG ─────────────────────────────────────────────────────────────
+MAX_CACHE_BYTES = 96 * 1024 * 1024   # ~30 full-screen 32-bit surfaces
+SCREENS_CACHED  = 8                  # full-screen surfaces kept at any window size
+BUILD_DIR       = "assets/build"     # written by games.build_assets
+MANIFEST        = os.path.join(BUILD_DIR, "manifest.json")
+
+
+# ─── SURFACE CACHE ──────────────────────────────────────────────────────
+class SurfaceCache:
+    """LRU of surfaces with byte accounting and hit/miss counters."""
+
+    def __init__(self, max_bytes=MAX_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes     = 0
+        self.hits      = 0
+        self.misses    = 0
+        self._cache    = OrderedDict()   # key -> (surface, nbytes)
+
+    def get(self, key):
+        entry = self._cache.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._cache.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, surf):
+        nbytes = surf.get_pitch() * surf.get_height()
+        old = self._cache.pop(key, None)
+        if old is not None:
+            self.bytes -= old[1]
+        self._cache[key] = (surf, nbytes)
+        self.bytes += nbytes
+        # always keep the newest entry, even if it alone is over budget
+        while self.bytes > self.max_bytes and len(self._cache) > 1:
+            _, (_, evicted) = self._cache.popitem(last=False)
+            self.bytes -= evicted
+        return surf
+
+    def clear(self):
+        self._cache.clear()
+        self.bytes = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries":  len(self._cache),
+            "bytes":    self.bytes,
+            "hits":     self.hits,
+            "misses":   self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+# ─── ASSET MANAGER ──────────────────────────────────────────────────────
+class AssetManager(SurfaceCache):
+    """Decoded, scaled and display-converted images keyed by (path, size)."""
+
+    def image(self, path, size=None, smooth=False):
+        key  = (path, tuple(size) if size else None, smooth)
+        surf = self.get(key)
+        if surf is not None:
+            return surf
+
+        surf = PREFETCH.take(key) or decode_image(path, size, smooth)
+        return self.put(key, convert(surf))
+
+    def reserve(self, screen_size):
+        # grow the budget so a big window (4K is ~32 MB a screen) does not
+        # evict and rescale backgrounds on every scene change
+        w, h = screen_size
+        self.max_bytes = max(self.max_bytes, SCREENS_CACHED * w * h * 4)
+
+    def prefetch(self, path, size=None, smooth=False):
+        # decode + scale on the worker thread; image() converts on first use
+        key = (path, tuple(size) if size else None, smooth)
+        if key not in self._cache:
+            PREFETCH.submit(key, decode_image, path, size, smooth)
+
+
+# ─── BAKED ASSETS ───────────────────────────────────────────────────────
+class BakedAssets:
+    """Pre-scaled backgrounds and the image atlas from games.build_assets.
+
+    A baked copy is only used while its source still has the size and mtime
+    recorded in the manifest; otherwise callers fall back to the original.
+    """
+
+    def __init__(self, manifest=MANIFEST):
+        self.path      = manifest
+        self._manifest = None
+        self._atlas    = None
+        self._lock     = threading.Lock()
+
+    def manifest(self):
+        with self._lock:
+            if self._manifest is None:
+                try:
+                    with open(self.path, "r") as f:
+                        self._manifest = json.load(f)
+                except (OSError, ValueError):
+                    self._manifest = {}
+            return self._manifest
+
+    def fresh(self, path):
+        src = self.manifest().get("sources", {}).get(path)
+        if not src:
+            return False
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        return src["mtime"] == st.st_mtime and src["bytes"] == st.st_size
+
+    def atlas(self):
+        with self._lock:
+            if self._atlas is None:
+                self._atlas = pygame.image.load(os.path.join(BUILD_DIR, self._manifest["atlas"]["file"]))
+            return self._atlas
+
+    def decode(self, path, size):
+        manifest = self.manifest()
+        bg = manifest.get("backgrounds", {}).get(path)
+        if bg and tuple(bg["size"]) == tuple(size) and self.fresh(path):
+            return pygame.image.load(os.path.join(BUILD_DIR, bg["file"]))
+        frame = manifest.get("atlas", {}).get("frames", {}).get(path)
+        if frame and tuple(frame[2:]) == tuple(size) and self.fresh(path):
+            return self.atlas().subsurface(frame)
+        return None
+
+
+BAKED = BakedAssets()
+
+def decode_image(path, size=None, smooth=False):
+    surf = BAKED.decode(path, size) if size else None
+    if surf is not None:
+        return surf
+    surf = pygame.image.load(path)
+    if size and surf.get_size() != tuple(size):
+        scale = pygame.transform.smoothscale if smooth else pygame.transform.scale
+        surf = scale(surf, size)
+    return surf
+
+def convert(surf):
+    # convert() needs a display mode; before set_mode keep the raw surface
+    if pygame.display.get_surface() is None:
+        return surf
+    if surf.get_flags() & pygame.SRCALPHA:
+        return surf.convert_alpha()
+    return surf.convert()
+
+
+ASSETS = AssetManager()
+
+def load_image(path, size=None, smooth=False):
+    return ASSETS.image(path, size, smooth)
+
+def prefetch_image(path, size=None, smooth=False):
+    ASSETS.prefetch(path, size, smooth)
@@ -0,0 +1,139 @@
+import os
+import struct
+import time
+from bisect import bisect_left
+from collections import namedtuple
+from urllib.parse import quote, unquote
+
+# ─── CONFIG ─────────────────────────────────────────────────────────────
+LOG_DIR          = "attempts"
+SEGMENT_RECORDS  = 16384     # 1 MiB of records per segment file
+FLUSH_RECORDS    = 64        # buffered answers before an automatic write
+TEXT_BYTES       = 16        # UTF-8 bytes kept of each word/answer/response
+
+MAGIC   = b"LLAT"
+VERSION = 1
+HEADER  = struct.Struct("<4sHH8x")                  # magic, version, record size
+RECORD  = struct.Struct("<dfBBBx16s16s16s")         # 64 bytes, see Attempt
+
+GAME_CODES  = {"treasure": 1, "unjumble": 2, "add_letters": 3, "memory": 4}
+GAME_NAMES  = {v: k for k, v in GAME_CODES.items()}
+# every game spells its two grade bands differently
+LEVEL_CODES = {"K": 1, "K1": 1, "k": 1, "Spelling": 2, "23": 2, "spelling": 2}
+LEVEL_NAMES = {1: "K-1", 2: "2-3"}
+
+Attempt = namedtuple("Attempt", "ts rt_ms game level correct word expected response")
+
+
+def student_dir(student, root=LOG_DIR):
+    return os.path.join(root, quote(student.strip().casefold(), safe=""))
+
+def clip(s):
+    # `s` as the log stores it: at most TEXT_BYTES, cut between characters
+    return s.encode("utf-8")[:TEXT_BYTES].decode("utf-8", "ignore")
+
+def _text(s):
+    return clip(s).encode("utf-8")
+
+def _untext(b):
+    return b.rstrip(b"\0").decode("utf-8", "replace")
+
+
+# ─── ATTEMPT LOG ────────────────────────────────────────────────────────
+class AttemptLog:
+    """Append-only per-answer log in fixed-size binary segments.
+
+    Layout: attempts/<student>/<seq>.seg, each a 16-byte header followed by
+    64-byte little-endian records (timestamp, response time, game, level,
+    correct, target word, expected answer, typed response). Records are
+    time-ordered per file, so a student's range scan only reads that
+    student's directory and bisects each segment by timestamp.
+    """
+
+    def __init__(self, root=LOG_DIR):
+        self.root    = root
+        self.student = None
+        self._buffer = bytearray()
+        self._listeners = []
+
+    def on_record(self, cb):
+        # cb(student, game, level, word, correct, ts) after every answer
+        self._listeners.append(cb)
+
+    def record(self, game, level, word, expected, response, correct, rt_ms):
+        if self.student is None:
+            return
+        ts = time.time()
+        self._buffer += RECORD.pack(
+            ts, rt_ms, GAME_CODES.get(game, 0), LEVEL_CODES.get(level, 0),
+            bool(correct), _text(word), _text(expected), _text(response))
+        for cb in self._listeners:
+            cb(self.student, game, level, word, bool(correct), ts)
+        if len(self._buffer) >= FLUSH_RECORDS * RECORD.size:
+            self.flush()
+
+    def flush(self):
+        if not self._buffer or self.student is None:
+            return
+        directory = student_dir(self.student, self.root)
+        os.makedirs(directory, exist_ok=True)
+        data, self._buffer = bytes(self._buffer), bytearray()
+        while data:
+            path, room = self._tail_segment(directory)
+            chunk, data = data[:room * RECORD.size], data[room * RECORD.size:]
+            with open(path, "ab") as f:
+                if f.tell() == 0:
+                    f.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+                f.write(chunk)
+
+    def set_student(self, student):
+        self.flush()
+        self.student = student
+
+    def _tail_segment(self, directory):
+        segments = sorted(f for f in os.listdir(directory) if f.endswith(".seg"))
+        if segments:
+            path  = os.path.join(directory, segments[-1])
+            count = max(0, os.path.getsize(path) - HEADER.size) // RECORD.size
+            if count < SEGMENT_RECORDS:
+                return path, SEGMENT_RECORDS - count
+            seq = int(segments[-1][:-4]) + 1
+        else:
+            seq = 0
+        return os.path.join(directory, f"{seq:06d}.seg"), SEGMENT_RECORDS
+
+    # ─── reads ───────────────────────────────────────────────────────
+    def students(self):
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(unquote(d) for d in os.listdir(self.root)
+                      if os.path.isdir(os.path.join(self.root, d)))
+
+    def segments(self, student):
+        directory = student_dir(student, self.root)
+        if not os.path.isdir(directory):
+            return []
+        return [os.path.join(directory, f) for f in sorted(os.listdir(directory)) if f.endswith(".seg")]
+
+    def scan(self, student, since=None, until=None):
+        # yield the student's Attempts with since <= ts < until
+        for path in self.segments(student):
+            with open(path, "rb") as f:
+                data = f.read()
+            n  = (len(data) - HEADER.size) // RECORD.size
+            ts = lambda i: struct.unpack_from("<d", data, HEADER.size + i * RECORD.size)[0]
+            if n == 0 or (since is not None and ts(n - 1) < since):
+                continue
+            if until is not None and ts(0) >= until:
+                break
+            start = bisect_left(range(n), since, key=ts) if since is not None else 0
+            for i in range(start, n):
+                rec = RECORD.unpack_from(data, HEADER.size + i * RECORD.size)
+                if until is not None and rec[0] >= until:
+                    return
+                yield Attempt(rec[0], rec[1], GAME_NAMES.get(rec[2], "?"),
+                              LEVEL_NAMES.get(rec[3], "?"), bool(rec[4]),
+                              _untext(rec[5]), _untext(rec[6]), _untext(rec[7]))
+
+
+ATTEMPTS = AttemptLog()
@@ -0,0 +1,84 @@
+import time
+from collections import deque
+import pygame
+from games.prefetch import PREFETCH
+
+# ─── CONFIG ─────────────────────────────────────────────────────────────
+FREQUENCY       = 44100
+SAMPLE_SIZE     = -16
+STEREO          = 2
+BUFFER          = 256    # samples per mixer callback (~6 ms at 44.1 kHz)
+VOICE           = 0      # channel reserved for word clips
+LATENCY_SAMPLES = 200
+
+
+# ─── AUDIO ENGINE ───────────────────────────────────────────────────────
+class AudioEngine:
+    """Mixer opened once with a small buffer, plus a decoded clip cache.
+
+    Clips are decoded to pygame.mixer.Sound on the prefetch worker and played
+    on a reserved channel, so a click never touches the disk or a decoder.
+    play() records the part of click-to-sound we control: from the click
+    being handled to the channel starting (a decode on a cache miss shows
+    up here). After that the mixer adds up to one buffer (buffer_ms) and
+    the OS/device its own output latency, which pygame cannot observe.
+    """
+
+    def __init__(self):
+        self.clips     = {}     # path -> Sound
+        self.latencies = deque(maxlen=LATENCY_SAMPLES)
+        self.voice     = None
+
+    def init(self):
+        if self.voice is not None:
+            return
+        if pygame.mixer.get_init():
+            pygame.mixer.quit()
+        pygame.mixer.init(FREQUENCY, SAMPLE_SIZE, STEREO, BUFFER)
+        pygame.mixer.set_reserved(VOICE + 1)
+        self.voice = pygame.mixer.Channel(VOICE)
+
+    def load(self, paths):
+        # queue {name: path} clips for decoding; returns the mapping
+        for path in paths.values():
+            if path not in self.clips:
+                PREFETCH.submit(("sound", path), pygame.mixer.Sound, path)
+        return paths
+
+    def clip(self, path):
+        sound = self.clips.get(path)
+        if sound is None:
+            sound = PREFETCH.take(("sound", path)) or pygame.mixer.Sound(path)
+            self.clips[path] = sound
+        return sound
+
+    def play(self, path, clicked_at=None):
+        clicked_at = clicked_at or time.perf_counter()
+        sound = self.clip(path)
+        self.voice.stop()
+        self.voice.play(sound)
+        self.latencies.append((time.perf_counter() - clicked_at) * 1000)
+
+    def buffer_ms(self):
+        # the mixer's buffer at the frequency it actually opened with
+        return 1000 * BUFFER / (pygame.mixer.get_init() or (FREQUENCY,))[0]
+
+    def stop(self):
+        if self.voice is not None:
+            self.voice.stop()
+
+    def stats(self):
+        if not self.latencies:
+            return {"plays": 0}
+        ordered = sorted(self.latencies)
+        return {
+            "plays":     len(ordered),
+            "buffer_ms": self.buffer_ms(),
+            "mean_ms":   sum(ordered) / len(ordered),
+            "p50_ms":    ordered[len(ordered) // 2],
+            "p95_ms":    ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+            "max_ms":    ordered[-1],
+        }
+
+
+AUDIO = AudioEngine()
@@ -0,0 +1,389 @@
+"""Benchmark the hot paths: python -m games.bench [--quick] [--baseline FILE]
+
+Covers frame cost per screen at 1024x768, re-layout after a window resize,
+image load + scale, font.render throughput, keypress-to-screen latency in
+the answer box, memory-match click-to-play time and profile load/save with
+synthetic files of 10, 1k and 100k students. Baked assets are brought up
+to date (games.build_assets) before measuring. Results go to JSON; the run
+fails (exit 1) when a median is over its budget below, or more than
+--max-ratio slower than the same metric in --baseline.
+"""
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from games.headless import use_dummy_drivers
+
+# ─── CONFIG ─────────────────────────────────────────────────────────────
+SCREEN_SIZE  = (1024, 768)
+RESIZE_SIZES = ((1366, 768), (1920, 1080), (3840, 2160))
+FONT_PATH    = "assets/OpenDyslexic-Regular.otf"
+RESULTS_FILE = "bench_results.json"
+STUDENTS     = (10, 1000, 100000)
+NOISE_MS     = 0.5       # differences below this never count as regressions
+
+# median budgets in ms, first matching pattern wins
+BUDGETS = {
+    "frame.*.full":              40.0,
+    "frame.*.steady":             5.0,
+    "frame.*.page_turn":         40.0,
+    "resize.*.cold":           1000.0,     # background rescale, fonts, text
+    "resize.*.warm":             60.0,     # all cached: a full repaint
+    "image.backgrounds.raw":    300.0,     # whole set, 4 screens
+    "image.backgrounds.cold":    40.0,     # baked BMPs, no decode or scale
+    "image.image_game.raw":     400.0,     # whole set, 16 tiles
+    "image.image_game.cold":     50.0,     # baked atlas
+    "image.*.warm":               0.5,
+    "font.render.raw":            2.0,
+    "font.render.cached":         0.05,
+    "font.typeset.*":             2.0,
+    "audio.click_to_play":        2.0,     # mixer buffer and device not included
+    "input.key_to_screen":        5.0,
+    "profiles.migrate.100000": 20000.0,
+    "profiles.migrate.*":       2000.0,
+    "profiles.load_all.100000": 3000.0,
+    "profiles.load_all.*":       300.0,
+    "profiles.load_one.*":         5.0,
+    "profiles.save_one.*":        50.0,
+    "legacy_json.*.100000":     5000.0,
+    "legacy_json.*":             500.0,
+}
+
+
+# ─── TIMING ─────────────────────────────────────────────────────────────
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t) * 1000)
+    return summarize(samples)
+
+def summarize(samples):
+    ordered = sorted(samples)
+    return {
+        "median_ms": round(statistics.median(ordered), 4),
+        "p95_ms":    round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 4),
+        "n":         len(ordered),
+    }
+
+
+# ─── BENCHMARKS ─────────────────────────────────────────────────────────
+def bench_frames(screen, font, small_font, repeat):
+    # full redraw and no-change frame for every screen, in its playing state
+    import main
+    from games.engine import Engine
+    from games.scenes import PopupScene
+    from games.profiles import default_scores
+    from games.game_to_letter import TreasureHuntScene
+    from games.game_unjumble import UnjumbleScene
+    from games.add_letters import AddLettersScene
+    from games.memory_match import MemoryMatchScene
+
+    def start(scene, *answers):
+        engine = Engine(screen)
+        engine.push(scene)
+        for answer in answers:            # level select, instructions ...
+            engine.pop(answer)
+        return engine.top
+
+    def big_deck(words=200):
+        # a whole term's vocabulary, paged
+        scene = start(MemoryMatchScene(small_font, deck=None), "k", True)
+        path  = next(iter(scene.clips.values()))
+        scene.clips = {f"word{i}": path for i in range(words)}
+        scene.deal(list(scene.clips))
+        return scene
+
+    screens = {
+        "start":       lambda: start(main.StartScene()),
+        "username":    lambda: start(main.UsernameScene(font)),
+        "map":         lambda: start(main.MapScene(font, "Bench", {"scores": default_scores()}, None)),
+        "popup":       lambda: start(PopupScene(font, ["Great job! 9/10 correct.", "You passed!"])),
+        "treasure":    lambda: start(TreasureHuntScene(font), "K"),
+        "unjumble":    lambda: start(UnjumbleScene(font), "Spelling"),
+        "add_letters": lambda: start(AddLettersScene(font), "23"),
+        "memory":      lambda: start(MemoryMatchScene(small_font), "k", True),
+        "memory_200":  big_deck,
+    }
+    results = {}
+    for name, make in screens.items():
+        scene = make()
+        def full():
+            scene.canvas.invalidate()
+            scene.draw(scene.canvas)
+            scene.canvas.present()
+        def steady():
+            scene.draw(scene.canvas)
+            scene.canvas.present()
+        results[f"frame.{name}.full"]   = timed(full, repeat)
+        results[f"frame.{name}.steady"] = timed(steady, repeat)
+
+    scene = big_deck()
+    def page_turn():
+        scene.turn(1)
+        scene.draw(scene.canvas)
+        scene.canvas.present()
+    results["frame.memory_200.page_turn"] = timed(page_turn, repeat)
+    return results
+
+def bench_resize(screen, font, repeat):
+    # treasure hunt laid out at a new window size: with nothing cached for
+    # that size (cold) and coming back to it (warm)
+    from games.assets import ASSETS
+    from games.engine import Engine
+    from games.game_to_letter import TreasureHuntScene
+    from games.text import TEXT
+
+    engine = Engine(screen)
+    engine.push(TreasureHuntScene(font))
+    engine.pop("K")
+    scene = engine.top
+    def show(size):
+        engine.resize(size)
+        scene.draw(scene.canvas)
+        scene.canvas.present()
+
+    results = {}
+    for size in RESIZE_SIZES:
+        for kind in ("cold", "warm"):
+            samples = []
+            for _ in range(repeat):
+                show(SCREEN_SIZE)
+                if kind == "cold":
+                    ASSETS.clear()
+                    TEXT.clear()
+                t = time.perf_counter()
+                show(size)
+                samples.append((time.perf_counter() - t) * 1000)
+            results[f"resize.{size[0]}x{size[1]}.{kind}"] = summarize(samples)
+    show(SCREEN_SIZE)
+    return results
+
+def bench_images(repeat):
+    import pygame
+    from games.assets import ASSETS
+    from games.build_assets import BACKGROUNDS, ATLAS_DIR, TILE_SIZE
+    from games.prefetch import PREFETCH
+
+    sets = {
+        "backgrounds": [(p, SCREEN_SIZE) for p in BACKGROUNDS],
+        "image_game":  [(os.path.join(ATLAS_DIR, f), TILE_SIZE)
+                        for f in sorted(os.listdir(ATLAS_DIR)) if f.endswith(".png")],
+    }
+    results = {}
+    for name, specs in sets.items():
+        def raw():
+            for path, size in specs:
+                pygame.transform.smoothscale(pygame.image.load(path), size).convert()
+        def cold():
+            PREFETCH.cancel()
+            ASSETS.clear()
+            for path, size in specs:
+                ASSETS.image(path, size, smooth=True)
+        def warm():
+            for path, size in specs:
+                ASSETS.image(path, size, smooth=True)
+        per_image = len(specs)
+        for kind, fn in (("raw", raw), ("cold", cold), ("warm", warm)):
+            r = timed(fn, repeat)
+            results[f"image.{name}.{kind}"] = {**r, "images": per_image,
+                                               "per_image_ms": round(r["median_ms"] / per_image, 4)}
+    return results
+
+def bench_font(font, repeat):
+    from games.content import CONTENT
+    from games.text import TEXT, render_text
+    from games.typeset import PLAIN, READING, atlas_for, typeset
+
+    words = [item.word for key in CONTENT.keys() for item in CONTENT.items(*key)]
+    words += ["Type the letter this image starts with:", "Press SPACE to continue", "Correct!"]
+    color = (0, 0, 0)
+
+    def raw():
+        for w in words:
+            font.render(w, True, color)
+    def cached():
+        for w in words:
+            render_text(font, w, color)
+    def atlas_plain():
+        for w in words:
+            typeset(font, w, color, PLAIN)
+    def atlas_spaced():
+        for w in words:
+            typeset(font, w, color, READING)
+
+    TEXT.clear()
+    render_text(font, "warm", color)
+    atlas_for(font)                       # rasterised once per font size
+    results = {}
+    for name, fn in (("render.raw", raw), ("render.cached", cached),
+                     ("typeset.plain", atlas_plain), ("typeset.reading", atlas_spaced)):
+        r = timed(fn, repeat)
+        per = r["median_ms"] / len(words)
+        results[f"font.{name}"] = {"median_ms": round(per, 5), "p95_ms": round(r["p95_ms"] / len(words), 5),
+                                          "n": r["n"], "renders_per_sec": round(1000 / per) if per else None}
+    return results
+
+def bench_input(screen, font, repeat):
+    # type into the unjumble answer box and time each key to the screen
+    import pygame
+    from games.engine import Engine
+    from games.game_unjumble import UnjumbleScene
+    from games.textinput import LATENCIES
+
+    engine = Engine(screen)
+    engine.push(UnjumbleScene(font))
+    engine.pop("Spelling")
+    scene = engine.top
+    LATENCIES.clear()
+    for i in range(repeat):
+        if len(scene.typed) == len(scene.word):
+            e = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_BACKSPACE, unicode="\b", mod=0, scancode=0)
+        else:
+            e = pygame.event.Event(pygame.TEXTINPUT, text=scene.word[len(scene.typed)])
+        scene.handle(e)
+        scene.draw(scene.canvas)
+        scene.canvas.present()
+    return {"input.key_to_screen": summarize(list(LATENCIES))}
+
+def bench_audio(repeat):
+    from games.audio import AUDIO
+    from games.content import CONTENT
+
+    AUDIO.init()
+    clips = AUDIO.load({item.word: item.path for item in CONTENT.items("memory", "k")})
+    paths = list(clips.values())
+    for path in paths:
+        AUDIO.clip(path)                  # decoded, as after the instructions popup
+    samples = []
+    for i in range(repeat):
+        AUDIO.play(paths[i % len(paths)], time.perf_counter())
+        samples.append(AUDIO.latencies[-1])
+    AUDIO.stop()
+    # what AudioEngine can observe; the mixer buffer (AUDIO.buffer_ms) and the
+    # device's output latency come on top and are not measured
+    return {"audio.click_to_play": summarize(samples)}
+
+def bench_profiles(sizes, repeat):
+    from games.profiles import GAMES, ProfileStore, load_legacy
+
+    results = {}
+    for n in sizes:
+        tmp = tempfile.mkdtemp(prefix="bench-profiles-")
+        try:
+            legacy = os.path.join(tmp, "profiles.json")
+            rng    = random.Random(n)
+            names  = [f"Student{i}" for i in range(n)]
+            data   = {name: {"levels_completed": [], "scores": {g: round(rng.random(), 2) for g in GAMES}}
+                      for name in names}
+            reps   = max(1, repeat // 10) if n >= 100000 else repeat
+
+            # what save_profiles/load_profiles did: rewrite/parse the whole file
+            def json_save():
+                with open(legacy, "w") as f:
+                    json.dump(data, f, indent=2)
+            results[f"legacy_json.save.{n}"] = timed(json_save, reps)
+            results[f"legacy_json.load.{n}"] = timed(lambda: load_legacy(legacy), reps)
+
+            counter = iter(range(1 << 30))
+            def migrate():
+                ProfileStore(os.path.join(tmp, f"m{next(counter)}.db"), legacy).close()
+            results[f"profiles.migrate.{n}"] = timed(migrate, 1 if n >= 100000 else min(repeat, 5))
+
+            store = ProfileStore(os.path.join(tmp, "m0.db"), None)
+            results[f"profiles.load_one.{n}"] = timed(lambda: store.get(rng.choice(names)), repeat)
+            results[f"profiles.save_one.{n}"] = timed(
+                lambda: store.set_score(rng.choice(names), "treasure", rng.random()), repeat)
+            results[f"profiles.load_all.{n}"] = timed(store.all, reps)
+            store.close()
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+    return results
+
+
+# ─── REGRESSIONS ────────────────────────────────────────────────────────
+def budget(metric):
+    for pattern, ms in BUDGETS.items():
+        if fnmatch.fnmatchcase(metric, pattern):
+            return ms
+    return None
+
+def regressions(results, baseline=None, max_ratio=1.5):
+    failures = []
+    for metric, r in results.items():
+        limit = budget(metric)
+        if limit is not None and r["median_ms"] > limit:
+            failures.append(f"{metric}: {r['median_ms']:.3f} ms over budget {limit} ms")
+        old = (baseline or {}).get(metric)
+        if old and r["median_ms"] > old["median_ms"] * max_ratio \
+                and r["median_ms"] - old["median_ms"] > NOISE_MS:
+            failures.append(f"{metric}: {r['median_ms']:.3f} ms vs baseline {old['median_ms']:.3f} ms")
+    return failures
+
+
+def run(quick=False):
+    import pygame
+    use_dummy_drivers()
+    pygame.init()
+    from games.build_assets import build
+    from games.text import FONTS
+    # the *.cold image budgets assume baked assets: bake (or refresh) them
+    # before anything is loaded, so a fresh checkout measures the same thing
+    baked      = build()
+    screen     = pygame.display.set_mode(SCREEN_SIZE, pygame.RESIZABLE)
+    font       = FONTS.font(FONT_PATH, 36)
+    small_font = FONTS.font(FONT_PATH, 20)
+    repeat     = 10 if quick else 50
+
+    results = {}
+    results.update(bench_frames(screen, font, small_font, repeat))
+    results.update(bench_resize(screen, font, max(3, repeat // 5)))
+    results.update(bench_images(max(3, repeat // 5)))
+    results.update(bench_font(font, repeat))
+    results.update(bench_input(screen, font, repeat))
+    results.update(bench_audio(repeat))
+    results.update(bench_profiles(STUDENTS[:2] if quick else STUDENTS, repeat))
+    pygame.quit()
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python":    sys.version.split()[0],
+            "pygame":    pygame.version.ver,
+            "platform":  platform.platform(),
+            "quick":     quick,
+            "baked":     len(baked),      # sources rebuilt before the run
+        },
+        "results": results,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", default=RESULTS_FILE, help="where to write the JSON results")
+    parser.add_argument("--baseline", help="earlier results file to compare against")
+    parser.add_argument("--max-ratio", type=float, default=1.5, help="allowed slowdown vs baseline")
+    parser.add_argument("--quick", action="store_true", help="fewer repeats, skip 100k students")
+    args = parser.parse_args()
+
+    report = run(args.quick)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)["results"]
+    report["failures"] = regressions(report["results"], baseline, args.max_ratio)
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+
+    for metric, r in sorted(report["results"].items()):
+        print(f"{metric:34s} {r['median_ms']:10.4f} ms  (p95 {r['p95_ms']:.4f})")
+    for failure in report["failures"]:
+        print("REGRESSION", failure)
+    sys.exit(1 if report["failures"] else 0)
@@ -0,0 +1,111 @@
+"""Bake display-ready assets: python -m games.build_assets [--force]
+
+Backgrounds are pre-scaled to the screen size and stored uncompressed
+(BMP: a straight read, where PNG decode of a full screen costs more than
+the scaling it saves) and the treasure-hunt images are scaled to their tile size and packed into one atlas. manifest.json
+records a content hash per source, so re-runs only rebuild what changed.
+"""
+import argparse
+import hashlib
+import json
+import os
+import pygame
+from games.assets import BUILD_DIR, MANIFEST
+
+# ─── CONFIG ─────────────────────────────────────────────────────────────
+SCREEN_SIZE = (1024, 768)
+BG_FORMAT   = "bmp"              # uncompressed: loads ~10x faster than PNG
+BACKGROUNDS = [
+    "assets/images/main_menu.png",
+    "assets/images/enter_name.png",
+    "assets/images/adventure_map.png",
+    "assets/images/default_screen.png",
+]
+ATLAS_DIR   = "assets/images/image_game"
+ATLAS_FILE  = "image_game_atlas.png"
+TILE_SIZE   = (200, 200)
+ATLAS_COLS  = 4
+
+
+def file_hash(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def source_entry(path):
+    st = os.stat(path)
+    return {"sha256": file_hash(path), "mtime": st.st_mtime, "bytes": st.st_size}
+
+def load_manifest():
+    if not os.path.exists(MANIFEST):
+        return {"sources": {}, "backgrounds": {}, "atlas": {}}
+    with open(MANIFEST, "r") as f:
+        return json.load(f)
+
+def save_manifest(manifest):
+    tmp = MANIFEST + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp, MANIFEST)
+
+
+# ─── BUILD STEPS ────────────────────────────────────────────────────────
+def build_backgrounds(manifest, sources, force):
+    built = []
+    for path in BACKGROUNDS:
+        name = os.path.splitext(os.path.basename(path))[0]
+        out  = f"{name}_{SCREEN_SIZE[0]}x{SCREEN_SIZE[1]}.{BG_FORMAT}"
+        old  = manifest["sources"].get(path, {}).get("sha256")
+        baked = manifest["backgrounds"].get(path, {}).get("file")
+        if (not force and old == sources[path]["sha256"] and baked == out
+                and os.path.exists(os.path.join(BUILD_DIR, out))):
+            continue
+        surf = pygame.transform.smoothscale(pygame.image.load(path), SCREEN_SIZE)
+        pygame.image.save(surf, os.path.join(BUILD_DIR, out))
+        if baked and baked != out and os.path.exists(os.path.join(BUILD_DIR, baked)):
+            os.remove(os.path.join(BUILD_DIR, baked))          # older format
+        manifest["backgrounds"][path] = {"file": out, "size": list(SCREEN_SIZE)}
+        built.append(path)
+    return built
+
+def build_atlas(manifest, sources, force):
+    images = sorted(os.path.join(ATLAS_DIR, f) for f in os.listdir(ATLAS_DIR) if f.endswith(".png"))
+    digest = hashlib.sha256("".join(sources[p]["sha256"] for p in images).encode()).hexdigest()
+    atlas  = manifest.get("atlas", {})
+    if not force and atlas.get("sha256") == digest and os.path.exists(os.path.join(BUILD_DIR, ATLAS_FILE)):
+        return []
+
+    tw, th = TILE_SIZE
+    rows   = (len(images) + ATLAS_COLS - 1) // ATLAS_COLS
+    sheet  = pygame.Surface((ATLAS_COLS * tw, max(rows, 1) * th), pygame.SRCALPHA)
+    frames = {}
+    for i, path in enumerate(images):
+        row, col = divmod(i, ATLAS_COLS)
+        tile = pygame.transform.smoothscale(pygame.image.load(path), TILE_SIZE)
+        sheet.blit(tile, (col * tw, row * th))
+        frames[path] = [col * tw, row * th, tw, th]
+    pygame.image.save(sheet, os.path.join(BUILD_DIR, ATLAS_FILE))
+    manifest["atlas"] = {"file": ATLAS_FILE, "sha256": digest, "frames": frames}
+    return images
+
+def build(force=False):
+    os.makedirs(BUILD_DIR, exist_ok=True)
+    manifest = load_manifest()
+    images   = [os.path.join(ATLAS_DIR, f) for f in os.listdir(ATLAS_DIR) if f.endswith(".png")]
+    sources  = {p: source_entry(p) for p in BACKGROUNDS + images}
+
+    built  = build_backgrounds(manifest, sources, force)
+    built += build_atlas(manifest, sources, force)
+    manifest["sources"] = sources
+    save_manifest(manifest)
+    return built
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--force", action="store_true", help="rebuild everything")
+    args = parser.parse_args()
+    built = build(args.force)
+    print(f"rebuilt {len(built)} source(s)" if built else "assets up to date")
@@ -0,0 +1,184 @@
+import json
+import os
+import pickle
+import tempfile
+import threading
+from collections import namedtuple
+from games import distractors
+from games.distractors import DistractorIndex
+
+# ─── CONFIG ─────────────────────────────────────────────────────────────
+HERE        = os.path.dirname(__file__)
+WORD_BANK   = os.path.join(HERE, "word_bank.json")        # unjumble
+ADD_LETTERS = os.path.join(HERE, "add_letters.json")      # add letters
+IMAGES_DIR  = "assets/images/image_game"                  # treasure hunt
+SOUND_DIR   = "assets/audios"                             # memory match
+CACHE_FILE  = "assets/build/content.pickle"
+CACHE_VERSION = 2
+
+# answer:  what the student has to type (None = chosen per round)
+# display: the prompt shown, options: ranked distractors, path: image/clip
+Item = namedtuple("Item", "game level word answer display options path")
+
+
+class ContentError(ValueError):
+    pass
+
+
+# ─── SOURCES ────────────────────────────────────────────────────────────
+def _listing(directory, ext):
+    return sorted(f for f in os.listdir(directory) if f.endswith(ext)) if os.path.isdir(directory) else []
+
+def _treasure():
+    files = _listing(IMAGES_DIR, ".png")
+    for level in ("K", "Spelling"):
+        for f in files:
+            word = os.path.splitext(f)[0]
+            answer = word[0].upper() if level == "K" else word
+            yield Item("treasure", level, word, answer, None, (), os.path.join(IMAGES_DIR, f))
+
+def _unjumble():
+    with open(WORD_BANK, "r") as f:
+        bank = json.load(f)
+    for level, words in bank.items():
+        for word in words:
+            yield Item("unjumble", level, word, word, None, (), None)
+
+def _add_letters():
+    with open(ADD_LETTERS, "r") as f:
+        data = json.load(f)
+    k1, spelling = data.get("K1", []), data.get("23", {})
+    index = DistractorIndex(k1 + list(spelling))
+    for word in k1:
+        # the blank moves every round: one distractor pair per position
+        per_letter = tuple(index.options(word, i, 1) for i in range(len(word)))
+        yield Item("add_letters", "K1", word, None, None, per_letter, None)
+    for word, display in spelling.items():
+        start, length = display.find("_"), display.count("_")
+        if start < 0 or len(display) != len(word) or \
+                display.replace("_" * length, word[start:start + length], 1) != word:
+            raise ContentError(f"{ADD_LETTERS}: {display!r} does not blank out part of {word!r}")
+        answer = word[start:start + length]
+        yield Item("add_letters", "23", word, answer, display,
+                   index.options(word, start, length), None)
+
+def _memory():
+    for level in ("k", "spelling"):
+        directory = os.path.join(SOUND_DIR, level)
+        for f in _listing(directory, ".mp3"):
+            word = os.path.splitext(f)[0]
+            yield Item("memory", level, word, word, None, (), os.path.join(directory, f))
+
+COMPILERS = (_treasure, _unjumble, _add_letters, _memory)
+
+def sources():
+    # files and directories whose (mtime, size) decide whether the cache is
+    # fresh, the compilers in this file included
+    return [WORD_BANK, ADD_LETTERS, __file__, distractors.__file__, IMAGES_DIR, SOUND_DIR] + \
+           [os.path.join(SOUND_DIR, level) for level in ("k", "spelling")]
+
+def stamps():
+    out = {}
+    for path in sources():
+        try:
+            st = os.stat(path)
+            out[path] = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            out[path] = None
+    return out
+
+
+# ─── COMPILE ────────────────────────────────────────────────────────────
+def compile_index():
+    # -> {(game, level): (Item, ...)} with every word validated
+    index = {}
+    for compiler in COMPILERS:
+        for item in compiler():
+            if not item.word or not item.word.isalpha():
+                raise ContentError(f"{item.game}/{item.level}: bad word {item.word!r}")
+            index.setdefault((item.game, item.level), {}).setdefault(item.word.casefold(), item)
+    return {key: tuple(items.values()) for key, items in index.items()}
+
+
+# ─── REGISTRY ───────────────────────────────────────────────────────────
+class ContentRegistry:
+    """Every game's words, compiled once into an in-memory index.
+
+    The compiled index is pickled to assets/build with the (mtime, size) of
+    each source file/directory, so a normal start is one stat per source
+    plus one unpickle, however long the word lists get. Loading is locked:
+    the prefetch worker and the first game can both ask for it.
+    """
+
+    def __init__(self, cache=CACHE_FILE):
+        self.cache  = cache
+        self._index = None
+        self._words = {}
+        self._lock  = threading.Lock()
+
+    def load(self):
+        if self._index is not None:
+            return self
+        with self._lock:
+            if self._index is None:
+                self._load()
+        return self
+
+    def _load(self):
+        current = stamps()
+        index = self._read_cache(current)
+        if index is None:
+            index = compile_index()
+            self._write_cache(current, index)
+        # _index last: it marks the registry loaded for other threads
+        self._words = {(g, l, item.word.casefold()): item
+                       for (g, l), items in index.items() for item in items}
+        self._index = index
+
+    def reload(self):
+        with self._lock:
+            self._index = None
+            self._load()
+        return self
+
+    def keys(self):
+        return list(self.load()._index)
+
+    def items(self, game, level):
+        return list(self.load()._index.get((game, level), ()))
+
+    def words(self, game, level):
+        return [item.word for item in self.items(game, level)]
+
+    def get(self, game, level, word):
+        return self.load()._words.get((game, level, word.casefold()))
+
+    # ─── on-disk cache ───────────────────────────────────────────────
+    def _read_cache(self, current):
+        try:
+            with open(self.cache, "rb") as f:
+                version, saved, index = pickle.load(f)
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError, AttributeError):
+            return None
+        return index if version == CACHE_VERSION and saved == current else None
+
+    def _write_cache(self, current, index):
+        directory = os.path.dirname(self.cache)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            # a temp file of our own: another game instance may be writing too
+            fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        except OSError:
+            return      # read-only install: just compile every start
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((CACHE_VERSION, current, index), f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self.cache)
+        except OSError:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+
+CONTENT = ContentRegistry()
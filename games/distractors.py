@@ -0,0 +1,125 @@
+import random
+import string
+import zlib
+from functools import lru_cache
+
+# ─── CONFUSION TABLE ────────────────────────────────────────────────────
+# letters dyslexic readers commonly mirror, rotate or hear alike, strongest first
+LETTER_GROUPS = [
+    ("BDPQ",  1.0),     # mirror / flip
+    ("MW",    0.9),     # rotation
+    ("NU",    0.9),
+    ("NM",    0.6),
+    ("IL",    0.6),
+    ("FT",    0.6),
+    ("VW",    0.6),
+    ("HN",    0.5),
+    ("IJ",    0.5),
+    ("HK",    0.4),     # one ascender, h / k
+    ("LT",    0.4),     # tall stroke, l / t
+    ("SZ",    0.5),
+    ("CK",    0.5),
+    ("GQ",    0.5),
+    ("GJ",    0.4),
+    ("CS",    0.4),
+    ("FV",    0.4),
+    ("AEIOU", 0.4),     # short vowel sounds
+]
+
+# vowel teams and r-controlled vowels that spell (nearly) the same sound,
+# closest spellings first. A grapheme's own sound is the first group it
+# is in; the order of the groups and within them breaks ties.
+GRAPHEME_GROUPS = [
+    ("ER", "UR", "IR", "OR", "AR"),     # r-controlled: her / fur / bird
+    ("AU", "AW", "AL", "OR", "AR"),     # aw
+    ("OU", "OW", "OO", "AU", "AW"),     # ou / ow
+    ("AI", "AY", "EI", "EA", "EY"),     # long a
+    ("EA", "EE", "IE", "EI", "EY"),     # long e
+    ("OA", "OW", "OE", "OU", "OO"),     # long o
+    ("IG", "AY", "AI"),                 # long a before a silent gh (eight)
+]
+VOWELS = "AEIOU"
+
+SOUND_WEIGHT     = 1.0   # the answer's own sound group
+OTHER_SOUND      = 0.9   # another group the answer is in
+REVERSAL_WEIGHT  = 0.8   # "OS" -> "SO"
+VOWEL_WEIGHT     = 0.75  # a vowel of a grapheme misheard as another vowel
+SUBSTITUTE_SCALE = 0.7   # one letter of a grapheme swapped for a confusable
+UNRELATED_WEIGHT = 0.05  # any other letter, only used to fill up
+
+
+def _table():
+    letters, graphemes = {}, {}
+    for group, weight in LETTER_GROUPS:
+        for a in group:
+            for b in group:
+                if a != b:
+                    row = letters.setdefault(a, {})
+                    row[b] = max(row.get(b, 0), weight)
+    for a in {g for group in GRAPHEME_GROUPS for g in group}:
+        row = graphemes[a] = {}
+        weight = SOUND_WEIGHT
+        for group in GRAPHEME_GROUPS:
+            if a in group:
+                for b in group:
+                    if b != a and b not in row:
+                        row[b] = weight
+                weight = OTHER_SOUND
+    return letters, graphemes
+
+LETTERS, GRAPHEMES = _table()
+
+
+@lru_cache(maxsize=None)
+def ranked(answer):
+    # every same-length distractor for `answer`, most confusable first;
+    # equal scores keep table order, unrelated fillers a per-answer shuffle
+    answer = answer.upper()
+    scores = dict(GRAPHEMES.get(answer, {}))
+
+    def offer(cand, score):
+        if score > scores.get(cand, 0):
+            scores[cand] = score
+
+    if len(answer) > 1 and answer[::-1] != answer:
+        offer(answer[::-1], REVERSAL_WEIGHT)
+    scale = 1.0 if len(answer) == 1 else SUBSTITUTE_SCALE
+    for i, ch in enumerate(answer):
+        swap = lambda other: answer[:i] + other + answer[i+1:]
+        if len(answer) > 1 and ch in VOWELS:
+            for other in VOWELS:
+                if other != ch:
+                    offer(swap(other), VOWEL_WEIGHT)
+        for other, weight in LETTERS.get(ch, {}).items():
+            offer(swap(other), weight * scale)
+    rng = random.Random(zlib.crc32(answer.encode("utf-8")))
+    for i, ch in enumerate(answer):
+        for other in rng.sample(string.ascii_uppercase, 26):
+            if other != ch:
+                offer(answer[:i] + other + answer[i+1:], UNRELATED_WEIGHT * scale)
+    scores.pop(answer, None)
+    return tuple(sorted(scores, key=lambda c: -scores[c]))
+
+
+# ─── DISTRACTOR INDEX ───────────────────────────────────────────────────
+class DistractorIndex:
+    """Ranked distractors for a blank in a word, from the confusion table.
+
+    Built over the whole word list so a distractor that would spell another
+    word in the bank (LOG -> DOG) is never offered as a wrong answer.
+    """
+
+    def __init__(self, words):
+        self.words = {w.upper() for w in words}
+
+    def options(self, word, start, length, n=2):
+        word   = word.upper()
+        answer = word[start:start + length]
+        picked = []
+        for cand in ranked(answer):
+            if word[:start] + cand + word[start + length:] in self.words:
+                continue
+            picked.append(cand)
+            if len(picked) == n:
+                break
+        return tuple(picked)
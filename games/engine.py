@@ -0,0 +1,186 @@
+import pygame
+from games.assets import ASSETS, load_image
+from games.layout import fit, layout_for
+from games.profiler import PROFILER, TOGGLE_KEY
+from games.render import Canvas
+from games.scheduler import SCHEDULER
+from games.tweens import Timers
+
+# ─── CONFIG ─────────────────────────────────────────────────────────────
+DEFAULT_BG = "assets/images/default_screen.png"
+
+
+# ─── SCENE ──────────────────────────────────────────────────────────────
+class Scene:
+    """One screen on the engine's stack. Only the top scene gets events."""
+
+    def __init__(self):
+        self.engine = None
+        self.screen = None
+        self.canvas = None
+        self.timers = Timers()    # run by the engine while this scene is on top
+        self._then  = None
+
+    @classmethod
+    def assets(cls, size):
+        # (path, size, smooth) images the engine can warm before we show
+        return [(DEFAULT_BG, size, False)]
+
+    @property
+    def size(self):
+        return self.screen.get_size()
+
+    @property
+    def layout(self):
+        return layout_for(self.size)
+
+    def background(self):
+        return load_image(DEFAULT_BG, self.size)
+
+    def enter(self):
+        pass
+
+    def exit(self):
+        pass
+
+    def handle(self, e):
+        pass
+
+    def update(self):
+        pass
+
+    def draw(self, canvas):
+        pass
+
+    def resized(self):
+        # the window changed size; drop anything laid out for the old one
+        pass
+
+    def quit(self):
+        # window closed while we are on top; games override to keep a score
+        self.engine.pop()
+
+
+
+# ─── ENGINE ─────────────────────────────────────────────────────────────
+class Engine:
+    """Scene stack with the single event/update/draw loop."""
+
+    def __init__(self, screen):
+        self.screen   = screen
+        self.stack    = []
+        self.result   = None
+        self.quitting = False
+        self._on_quit = []
+        ASSETS.reserve(screen.get_size())
+
+    @property
+    def top(self):
+        return self.stack[-1] if self.stack else None
+
+    def push(self, scene, then=None):
+        # `then(result)` runs when the scene pops itself
+        if self.quitting:
+            return
+        scene.engine, scene.screen, scene._then = self, self.screen, then
+        for spec in scene.assets(self.screen.get_size()):
+            ASSETS.image(*spec)
+        scene.canvas = Canvas(self.screen, scene.background())
+        self.stack.append(scene)
+        scene.enter()
+
+    def replace(self, scene, then=None):
+        old = self.stack.pop()
+        old.exit()
+        self.push(scene, then or old._then)
+
+    def pop(self, result=None):
+        scene = self.stack.pop()
+        scene.exit()
+        if self.stack:
+            self.refresh(self.stack[-1])
+        else:
+            self.result = result
+        if scene._then:
+            scene._then(result)
+
+    def resize(self, size):
+        # window resized: re-lay out the top scene now, the others when shown
+        size   = fit(size)
+        screen = pygame.display.get_surface()
+        if screen is None or screen.get_size() != size:
+            screen = pygame.display.set_mode(size, pygame.RESIZABLE)
+        self.screen = screen
+        ASSETS.reserve(size)
+        if self.stack:
+            self.refresh(self.stack[-1])
+
+    def refresh(self, scene):
+        # full repaint of `scene`, rebuilding its background at a new size;
+        # backgrounds and text are cached per size, so each size scales once
+        if scene.canvas.size == self.screen.get_size():
+            scene.canvas.invalidate()
+            return
+        scene.screen = self.screen
+        for spec in scene.assets(self.screen.get_size()):
+            ASSETS.image(*spec)
+        scene.canvas.resize(self.screen, scene.background())
+        scene.resized()
+
+    def preload(self, scene_cls):
+        # decode the next scene's images on the worker while this one shows
+        for spec in scene_cls.assets(self.screen.get_size()):
+            ASSETS.prefetch(*spec)
+
+    def on_quit(self, callback):
+        # run `callback()` as soon as the window is closed
+        self._on_quit.append(callback)
+
+    def quit(self):
+        self.quitting = True
+        for callback in self._on_quit:
+            callback()
+        while self.stack:
+            top = self.stack[-1]
+            top.quit()
+            if self.stack and self.stack[-1] is top:
+                self.pop()
+
+    def run(self, scene, then=None):
+        self.push(scene, then)
+        while self.stack:
+            t = PROFILER.frame_start()
+            events = SCHEDULER.events()
+            t = PROFILER.phase("wait", t)
+            resizes = [e for e in events if e.type == pygame.VIDEORESIZE]
+            for e in events:
+                if e.type == pygame.KEYDOWN and e.key == TOGGLE_KEY:
+                    PROFILER.toggle()
+                    continue
+                if e.type == pygame.VIDEORESIZE:
+                    if e is resizes[-1]:          # a drag sends many; lay out once
+                        self.resize(e.size)
+                    continue
+                if e.type == pygame.QUIT:
+                    self.quit()
+                if not self.stack:
+                    break
+                self.top.handle(e)
+            if not self.stack:
+                break
+            t = PROFILER.phase("events", t)
+
+            self.top.timers.update()
+            if not self.stack:
+                break
+            top = self.top
+            top.update()
+            t = PROFILER.phase("update", t)
+            if top is self.top:
+                top.draw(top.canvas)
+                PROFILER.draw(top.canvas)
+                t = PROFILER.phase("draw", t)
+                top.canvas.present()
+                PROFILER.phase("flip", t)
+            PROFILER.frame_end()
+        return self.result
@@ -1,108 +1,58 @@
-import pygame, random, json, os
-from games.game_to_letter import popup
+from games.content import CONTENT
+from games.review import REVIEW
+from games import scrambles
+from games.text import render_text
+from games.engine import Engine
+from games.rounds import RoundGame
+from games.textinput import letters
 
 # CONFIG
-WORD_BANK = os.path.join(os.path.dirname(__file__), "word_bank.json")
-BG_IMAGE  = "assets/images/default_screen.png"
+DIFFICULTY = {"K": 0.3, "Spelling": 0.6}    # target scramble difficulty per level
 
-def scramble(word):
-    arr = list(word)
-    s   = word
-    while s == word:
-        random.shuffle(arr)
-        s = "".join(arr)
-    return s
+def scramble(word, difficulty=0.5):
+    return scrambles.pick(word, difficulty).text
 
-def ask_grade_level(screen, font):
-    sw, sh = screen.get_size()
-    bg = pygame.image.load(BG_IMAGE)
-    bg = pygame.transform.scale(bg, (sw, sh))
-    options = ["1) K–1", "2) Grade 2–3"]
-    prompt = "Choose your level:"
-    font_small = font
-    clock = pygame.time.Clock()
+class UnjumbleScene(RoundGame):
+    name = "unjumble"
 
-    while True:
-        for e in pygame.event.get():
-            if e.type == pygame.QUIT: return None
-            if e.type == pygame.KEYDOWN:
-                if e.unicode == "1": return "K"
-                elif e.unicode == "2": return "Spelling"
+    def make_rounds(self, level):
+        words = [item.word for item in REVIEW.select(self.name, level, CONTENT.items(self.name, level))]
+        for word in words:
+            scrambles.pool(word)     # precompute while the level loads
+        return words
 
-        screen.blit(bg, (0,0))
-        p = font.render(prompt, True, (0,0,0))
-        screen.blit(p, p.get_rect(center=(sw//2, sh//2 - 100)))
-        for i, line in enumerate(options):
-            surf = font_small.render(line, True, (0,0,0))
-            screen.blit(surf, surf.get_rect(center=(sw//2, sh//2 + i*50)))
-        pygame.display.flip()
-        clock.tick(30)
+    def setup_round(self, word):
+        self.word      = word
+        self.scrambled = scramble(word, DIFFICULTY.get(self.level, 0.5))
 
-def run_unjumble(screen, font):
-    level = ask_grade_level(screen, font)
-    if not level: return 0
-
-    clock = pygame.time.Clock()
-    sw, sh = screen.get_size()
-    bg = pygame.image.load(BG_IMAGE)
-    bg = pygame.transform.scale(bg, (sw, sh))
-
-    with open(WORD_BANK, "r") as f:
-        data = json.load(f)
-    words = data.get(level, [])
-    if not words: return 0
-    random.shuffle(words)
-    rounds = words
-    correct_count = 0
+    def target(self):
+        return self.word, self.word
 
-    for word in rounds:
-        scrambled = scramble(word)
-        entry = ""
-        feedback = ""
-        answered = False
+    def validator(self):
+        return letters(len(self.word))
 
-        while not answered:
-            for e in pygame.event.get():
-                if e.type == pygame.QUIT:
-                    return correct_count / len(rounds)
-                if e.type == pygame.KEYDOWN:
-                    if e.key == pygame.K_BACKSPACE:
-                        entry = entry[:-1]
-                    elif e.key == pygame.K_RETURN:
-                        if entry.lower() == word.lower():
-                            feedback = "Correct!"
-                            correct_count += 1
-                        else:
-                            feedback = "Wrong"
-                        answered = True
-                    elif e.unicode.isalpha() and len(entry) < len(word):
-                        entry += e.unicode
+    def check(self, typed):
+        ok = typed.lower() == self.word.lower()
+        return ok, "Correct!" if ok else "Wrong"
 
-            # draw
-            screen.blit(bg, (0,0))
-            sc = font.render(f"Unscramble: {scrambled}", True, (0,0,0))
-            screen.blit(sc, sc.get_rect(center=(sw//2, sh//2 - 100)))
+    def result_lines(self, accuracy):
+        return super().result_lines(accuracy) + ["Press SPACE to return"]
 
-            inp = font.render(entry, True, (0,0,0))
-            screen.blit(inp, inp.get_rect(center=(sw//2, sh//2)))
+    def draw_round(self, canvas):
+        ui   = self.layout
+        font = ui.font(self.font)
+        sc = render_text(font, f"Unscramble: {self.scrambled}", (0,0,0), style=self.style)
+        canvas.blit("scrambled", sc, center=ui.at(0.5, 0.5, dy=-100))
 
-            if feedback:
-                clr = (0,180,0) if feedback.startswith("Correct") else (200,0,0)
-                fb = font.render(feedback, True, clr)
-                screen.blit(fb, fb.get_rect(center=(sw//2, sh//2 + 80)))
+        self.input.draw(canvas, "entry", font, (0,0,0), self.style, center=ui.at(0.5, 0.5))
 
-            sp = font.render(f"Score: {correct_count}", True, (0,0,0))
-            screen.blit(sp, (20,20))
+        if self.feedback:
+            clr = (0,180,0) if self.feedback.startswith("Correct") else (200,0,0)
+            fb = self.feedback_text(font, clr)
+            canvas.blit("feedback", fb, center=ui.at(0.5, 0.5, dy=80))
 
-            pygame.display.flip()
-            clock.tick(30)
+        sp = render_text(font, f"Score: {self.correct}", (0,0,0))
+        canvas.blit("score", sp, topleft=ui.at(0, 0, 20, 20))
 
-        pygame.time.delay(800)
-
-    accuracy = correct_count / len(rounds)
-    popup(screen, font, [
-        f"You got {correct_count}/{len(rounds)}.",
-        "You passed!" if accuracy >= 0.8 else "Try again next time.",
-        "Press SPACE to return"
-    ])
-    return accuracy
+def run_unjumble(screen, font):
+    return Engine(screen).run(UnjumbleScene(font))
@@ -0,0 +1,204 @@
+"""Replay an input script without a display: python -m games.headless SCRIPT [TARGET]
+
+A script is JSON, either a list of steps or {"seed": N, "events": [...]}.
+Each step has a time in ms from the start and one action:
+
+    {"t": 0,    "key": "1"}            key press (pygame key name)
+    {"t": 300,  "text": "Apple"}       typed: key press + TEXTINPUT per character
+    {"t": 900,  "key": "return"}
+    {"t": 1500, "click": [85, 70]}     left click at (x, y)
+    {"t": 2000, "resize": [1920, 1080]} window resized by the user
+    {"t": 9000, "quit": true}          window close
+
+The script drives main.main (TARGET "main") or one game's run_* function.
+In fast mode (the default) time is virtual: steps are delivered one per
+frame, once pending timers (feedback, flashes) have run, which takes no
+real time. Running out of steps closes the window.
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from collections import deque
+import pygame
+from games.profiler import PROFILER
+from games.scheduler import ACTIVE_FPS, SCHEDULER
+
+# ─── CONFIG ─────────────────────────────────────────────────────────────
+SCREEN_SIZE = (1024, 768)
+FONT_PATH   = "assets/OpenDyslexic-Regular.otf"
+FONT_SIZE   = 36
+SPECIAL_TEXT = {"space": " ", "return": "\r", "backspace": "\b", "tab": "\t", "escape": "\x1b"}
+TARGETS     = ("main", "treasure", "unjumble", "add_letters", "memory")
+POLL_MS     = 50      # real-time mode: longest sleep between script checks
+
+
+def use_dummy_drivers():
+    # must run before pygame.init()
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+# ─── SCRIPT ─────────────────────────────────────────────────────────────
+def key_events(name, text=None):
+    # what SDL sends for one key press: KEYDOWN, TEXTINPUT if it types, KEYUP
+    if text is None:
+        text = name if len(name) == 1 else SPECIAL_TEXT.get(name, "")
+    key = pygame.key.key_code(name)
+    events = [pygame.event.Event(pygame.KEYDOWN, key=key, unicode=text, mod=0, scancode=0)]
+    if text.isprintable() and text:
+        events.append(pygame.event.Event(pygame.TEXTINPUT, text=text))
+    events.append(pygame.event.Event(pygame.KEYUP, key=key, unicode="", mod=0, scancode=0))
+    return events
+
+def to_events(step):
+    if "key" in step:
+        return key_events(step["key"])
+    if "text" in step:
+        return [e for ch in step["text"] for e in key_events(ch.lower() if ch.isalpha() else ch, ch)]
+    if "click" in step:
+        pos = tuple(step["click"])
+        return [pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1),
+                pygame.event.Event(pygame.MOUSEBUTTONUP, pos=pos, button=1)]
+    if "resize" in step:
+        w, h = step["resize"]
+        return [pygame.event.Event(pygame.VIDEORESIZE, size=(w, h), w=w, h=h)]
+    if step.get("quit"):
+        return [pygame.event.Event(pygame.QUIT)]
+    raise ValueError(f"unknown script step {step!r}")
+
+def load_script(path):
+    with open(path, "r") as f:
+        data = json.load(f)
+    return data if isinstance(data, dict) else {"events": data}
+
+
+class ScriptedInput:
+    """Event source for FrameScheduler.script that replays timed steps.
+
+    Real input is still drained (and passed through) so a visible window
+    stays responsive when a script is watched with --window.
+    """
+
+    def __init__(self, steps):
+        # steps become pygame events only when delivered (after pygame.init)
+        self.pending   = deque(sorted(steps, key=lambda s: s.get("t", 0)))
+        self.delivered = 0
+        self.start     = None
+
+    def poll(self, scheduler):
+        real = pygame.event.get()
+        if scheduler.fast:
+            due = self._next_fast(scheduler)
+        else:
+            due = self._next_realtime(scheduler)
+        if due is None:                           # script done: close the window
+            due = [] if scheduler.busy() else [pygame.event.Event(pygame.QUIT)]
+        self.delivered += len(due)
+        return real + due
+
+    def _next_fast(self, scheduler):
+        if scheduler.busy():
+            scheduler.skip_animation()
+            return []
+        if not self.pending:
+            return None
+        step = self.pending.popleft()
+        scheduler.virtual_ms = max(scheduler.virtual_ms, step.get("t", 0))
+        return to_events(step)
+
+    def _next_realtime(self, scheduler):
+        if self.start is None:
+            self.start = scheduler.ticks()
+        now = scheduler.ticks() - self.start
+        due = []
+        while self.pending and self.pending[0].get("t", 0) <= now:
+            due += to_events(self.pending.popleft())
+        if due:
+            return due
+        if not self.pending:
+            return None
+        if scheduler.animating():
+            scheduler.clock.tick(ACTIVE_FPS)
+        else:
+            pygame.time.wait(max(0, min(self.pending[0].get("t", 0) - now, POLL_MS)))
+        return []
+
+
+# ─── DRIVER ─────────────────────────────────────────────────────────────
+def run(target, steps, seed=0, fast=True, data_dir=None, student=None):
+    # play `steps` against `target`; returns a summary dict
+    from games.attempts import ATTEMPTS
+
+    data_dir = data_dir or tempfile.mkdtemp(prefix="lucky-letters-")
+    os.makedirs(data_dir, exist_ok=True)
+    ATTEMPTS.root = os.path.join(data_dir, "attempts")
+    random.seed(seed)
+    script = ScriptedInput(steps)
+    SCHEDULER.script, SCHEDULER.fast, SCHEDULER.virtual_ms = script, fast, 0
+    started = time.perf_counter()
+    try:
+        if target == "main":
+            import main
+            result = main.main(db=os.path.join(data_dir, "profiles.db"))
+        else:
+            result = run_game(target, student)
+    finally:
+        SCHEDULER.script, SCHEDULER.fast = None, False
+    return {
+        "target":     target,
+        "result":     result,
+        "seed":       seed,
+        "fast":       fast,
+        "events":     script.delivered,
+        "unplayed":   len(script.pending),
+        "wall_ms":    round((time.perf_counter() - started) * 1000, 1),
+        "virtual_ms": SCHEDULER.virtual_ms,
+        "data_dir":   data_dir,
+        "startup_ms": PROFILER.startup,
+    }
+
+def run_game(target, student=None):
+    from games.attempts import ATTEMPTS
+    from games.game_to_letter import run_treasure_hunt
+    from games.game_unjumble import run_unjumble
+    from games.add_letters import run_add_letters
+    from games.memory_match import run_memory_match
+    from games.text import FONTS
+    runners = {"treasure": run_treasure_hunt, "unjumble": run_unjumble,
+               "add_letters": run_add_letters, "memory": run_memory_match}
+
+    pygame.init()
+    screen = pygame.display.set_mode(SCREEN_SIZE, pygame.RESIZABLE)
+    font   = FONTS.font(FONT_PATH, FONT_SIZE)
+    ATTEMPTS.set_student(student)
+    try:
+        return runners[target](screen, font)
+    finally:
+        ATTEMPTS.flush()
+        pygame.quit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("script", help="JSON input script")
+    parser.add_argument("target", nargs="?", default="main", choices=TARGETS)
+    parser.add_argument("--seed", type=int, help="RNG seed (overrides the script's)")
+    parser.add_argument("--realtime", action="store_true", help="honour step times, feedback and flashes")
+    parser.add_argument("--window", action="store_true", help="use the real video/audio drivers")
+    parser.add_argument("--data", help="directory for profiles.db and attempts (default: temp)")
+    parser.add_argument("--student", help="log attempts as this student (game targets)")
+    parser.add_argument("--trace", help="write a Chrome trace of the run to this file")
+    args = parser.parse_args()
+
+    if not args.window:
+        use_dummy_drivers()
+    if args.trace:
+        PROFILER.start_trace(args.trace)
+    script = load_script(args.script)
+    seed   = args.seed if args.seed is not None else script.get("seed", 0)
+    summary = run(args.target, script["events"], seed=seed, fast=not args.realtime,
+                  data_dir=args.data, student=args.student)
+    print(json.dumps(summary, indent=2))
@@ -0,0 +1,44 @@
+from functools import lru_cache
+from games.text import FONTS
+
+# ─── CONFIG ─────────────────────────────────────────────────────────────
+BASE_SIZE = (1024, 768)      # the size every pixel offset is written for
+MIN_SIZE  = (800, 600)       # the window is not allowed smaller than this
+
+
+def fit(size):
+    return max(size[0], MIN_SIZE[0]), max(size[1], MIN_SIZE[1])
+
+
+# ─── LAYOUT ─────────────────────────────────────────────────────────────
+class Layout:
+    """Relative anchors for one window size.
+
+    Positions are a fraction of the window (0.5, 0.5 is the centre) plus an
+    offset in BASE_SIZE pixels, scaled by how much smaller the window's
+    tighter side is than the base. Layouts are shared per size (layout_for),
+    so everything derived from one is computed once per window size.
+    """
+
+    def __init__(self, size):
+        self.w, self.h = size
+        self.scale = min(self.w / BASE_SIZE[0], self.h / BASE_SIZE[1])
+
+    def px(self, n):
+        # a BASE_SIZE pixel length at this window size
+        return round(n * self.scale)
+
+    def at(self, fx, fy, dx=0, dy=0):
+        return round(self.w * fx) + self.px(dx), round(self.h * fy) + self.px(dy)
+
+    def size(self, w, h):
+        return max(1, self.px(w)), max(1, self.px(h))
+
+    def font(self, font, factor=1.0):
+        # `font` at this window's scale (fonts made by FONTS only)
+        return FONTS.scaled(font, self.scale * factor)
+
+
+@lru_cache(maxsize=8)
+def layout_for(size):
+    return Layout(tuple(size))
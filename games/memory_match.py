@@ -1,183 +1,279 @@
 import pygame
 import random
-import os
+import time
+from games.assets import ASSETS
+from games.text import FONTS, render_text
+from games.engine import Engine, Scene
+from games.render import faded, overlay
+from games.scenes import LevelSelectScene, PopupScene
+from games.tweens import ease_in
+from games.typeset import READING, typeset
+from games.prefetch import PREFETCH
+from games.audio import AUDIO
+from games.content import CONTENT
+from games.review import REVIEW
+from games.attempts import ATTEMPTS
 
 # ─── CONFIG ─────────────────────────────────────────────────────────────
-SOUND_BASE_DIR = "assets/audios"
-BG_IMAGE       = "assets/images/default_screen.png"
 CARD_COLOR     = (200, 200, 250)
 MATCHED_COLOR  = (0, 200, 0)
 BORDER_COLOR   = (50, 50, 100)
 TEXT_COLOR     = (0, 0, 0)
-CARD_W, CARD_H = 150, 100
+CARD_W, CARD_H = 150, 100       # base size; cards scale to fit the window
 GAP            = 20
+MAX_CARD_SCALE = 1.5             # small decks stop growing at this x base
+LABEL_PAD      = 8
+PAGE_WORDS     = 12              # word pairs per page; bigger decks are paged
+DECK           = None            # pairs per game; None deals every clip in the level's folder
+PAGER_H        = 50              # base px kept free for "Page i of n"
+FLASH_MS       = 1000            # "Matched!" / "Try Again" over the board
+FLASH_ALPHA    = 120
+PAGE_KEYS      = {pygame.K_RIGHT: 1, pygame.K_PAGEDOWN: 1, pygame.K_LEFT: -1, pygame.K_PAGEUP: -1}
+
+
+def card_face(value, matched, size, font):
+    # one surface per card look (value None: sound card), made once per size
+    key  = ("card", value, matched, size, font)
+    surf = ASSETS.get(key)
+    if surf is not None:
+        return surf
+    surf = pygame.Surface(size)
+    surf.fill(MATCHED_COLOR if matched else CARD_COLOR)
+    pygame.draw.rect(surf, BORDER_COLOR, surf.get_rect(), 2)
+    if value is not None:
+        label = typeset(font, value.upper(), TEXT_COLOR, READING)
+        room  = size[0] - 2*LABEL_PAD
+        if label.get_width() > room:               # long words shrink to fit
+            label = pygame.transform.smoothscale(
+                label, (room, max(1, label.get_height() * room // label.get_width())))
+        surf.blit(label, label.get_rect(center=surf.get_rect().center))
+    if pygame.display.get_surface() is not None:
+        surf = surf.convert()
+    return ASSETS.put(key, surf)
+
 
 class Card:
-    def __init__(self, rect, value, is_audio):
-        self.rect     = rect
+    def __init__(self, value, is_audio):
+        self.rect     = pygame.Rect(0, 0, 0, 0)
         self.value    = value
         self.is_audio = is_audio
         self.matched  = False
+        self.faces    = (None, None)          # (unmatched, matched) surfaces
+
+    def render(self, size, font):
+        label = None if self.is_audio else self.value
+        self.faces = (card_face(label, False, size, font), card_face(label, True, size, font))
 
-    def draw(self, screen, font):
-        fill_color = MATCHED_COLOR if self.matched else CARD_COLOR
-        pygame.draw.rect(screen, fill_color, self.rect)
-        pygame.draw.rect(screen, BORDER_COLOR, self.rect, 2)
-
-        if not self.is_audio:
-            txt = font.render(self.value.upper(), True, TEXT_COLOR)
-            screen.blit(txt, txt.get_rect(center=self.rect.center))
-
-def popup(screen, font, lines):
-    sw, sh = screen.get_size()
-    bg     = pygame.image.load(BG_IMAGE)
-    bg     = pygame.transform.scale(bg, (sw, sh))
-    overlay = pygame.Surface((sw, sh), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 180))
-
-    text_surfs  = [font.render(line, True, (255, 255, 255)) for line in lines]
-    prompt_surf = font.render("Press SPACE to continue", True, (200, 200, 200))
-    clock       = pygame.time.Clock()
-
-    while True:
-        for e in pygame.event.get():
-            if e.type == pygame.QUIT: return
-            if e.type == pygame.KEYDOWN and e.key == pygame.K_SPACE: return
-        screen.blit(bg, (0, 0))
-        screen.blit(overlay, (0, 0))
-        total_h = sum(s.get_height() for s in text_surfs) + 20*(len(text_surfs)-1)
-        y = (sh - total_h)//2
-        for surf in text_surfs:
-            rect = surf.get_rect(center=(sw//2, y + surf.get_height()//2))
-            screen.blit(surf, rect)
-            y += surf.get_height() + 20
-        screen.blit(prompt_surf, prompt_surf.get_rect(center=(sw//2, int(sh*0.85))))
-        pygame.display.flip()
-        clock.tick(30)
-
-def flash_message(screen, font, message, color):
-    overlay = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-    overlay.fill((*color, 120))
-    text_surf = font.render(message, True, (0, 0, 0))
-    clock     = pygame.time.Clock()
-    start     = pygame.time.get_ticks()
-    while pygame.time.get_ticks() - start < 1000:
-        for e in pygame.event.get():
-            if e.type == pygame.QUIT: return
-        screen.blit(overlay, (0, 0))
-        screen.blit(text_surf, text_surf.get_rect(center=screen.get_rect().center))
-        pygame.display.flip()
-        clock.tick(30)
-
-def ask_grade_level(screen, font):
-    sw, sh = screen.get_size()
-    bg = pygame.image.load(BG_IMAGE)
-    bg = pygame.transform.scale(bg, (sw, sh))
-
-    options = ["1) K–1", "2) Grade 2–3"]
-    prompt  = "Choose your level:"
-    clock = pygame.time.Clock()
-
-    while True:
-        for e in pygame.event.get():
-            if e.type == pygame.QUIT: return None
-            if e.type == pygame.KEYDOWN:
-                if e.unicode == "1": return "k"
-                elif e.unicode == "2": return "spelling"
-
-        screen.blit(bg, (0, 0))
-        prompt_surf = font.render(prompt, True, TEXT_COLOR)
-        screen.blit(prompt_surf, prompt_surf.get_rect(center=(sw // 2, sh // 2 - 100)))
-
-        for i, line in enumerate(options):
-            option_surf = font.render(line, True, TEXT_COLOR)
-            screen.blit(option_surf, option_surf.get_rect(center=(sw // 2, sh // 2 + i * 50)))
-
-        pygame.display.flip()
-        clock.tick(30)
+    def draw(self, canvas):
+        canvas.blit(self, self.faces[self.matched], topleft=self.rect.topleft)
 
 # ─── GAME LOGIC ─────────────────────────────────────────────────────────
+class MemoryMatchScene(Scene):
+    """Sound/word pairs on a grid, PAGE_WORDS pairs to a page.
+
+    Each page is laid out once per window size: every card gets its rect
+    and pre-rendered faces, and clicks are mapped to a card by grid
+    arithmetic. Drawing is one blit per card, so the canvas only repaints
+    cards whose face changed.
+    """
+
+    def __init__(self, font, deck=DECK):
+        super().__init__()
+        self.font           = font
+        self.deck           = deck        # words per game; None for the whole list
+        self.pages          = []          # [[Card]], a page holds both cards of a pair
+        self.page           = 0
+        self.grid           = None        # (left, top, w, h, gap, cols)
+        self.words          = []
+        self.clips          = {}
+        self.matched        = 0
+        self.selected_audio = None
+        self.flash          = None        # (message, colour, alpha tween)
+
+    @property
+    def cards(self):
+        return self.pages[self.page] if self.pages else []
+
+    def enter(self):
+        AUDIO.init()
+        self.engine.push(LevelSelectScene(self.font, {"1": "k", "2": "spelling"}),
+                         then=self.start)
+
+    def start(self, level):
+        if not level:
+            self.engine.pop(0)
+            return
+        self.level = level
+        items = CONTENT.items("memory", level)
+        items = REVIEW.select("memory", level, items, n=self.deck or len(items))
+        self.clips = {item.word: item.path for item in items}
+        if not self.clips:
+            self.engine.pop(0)
+            return
+
+        instructions = [
+            "Match each sound with its written word.",
+            "Click a sound card to hear it.",
+            "Then click the word that matches.",
+            "Make all matches to win!"
+        ]
+        self.engine.push(PopupScene(self.font, instructions))
+        self.deal(list(self.clips))
+
+    def deal(self, words):
+        # shuffle `words` into pages of sound + word cards
+        self.words = random.sample(words, len(words))
+        self.pages = []
+        for i in range(0, len(self.words), PAGE_WORDS):
+            chunk = self.words[i:i+PAGE_WORDS]
+            cards = [Card(w, True) for w in chunk] + [Card(w, False) for w in chunk]
+            random.shuffle(cards)
+            self.pages.append(cards)
+        self.show_page(0)
+
+    def show_page(self, page):
+        self.page = page
+        self.selected_audio = None
+        self.layout_cards()
+        # decode this page's clips (and the next page's) while it is read
+        for cards in self.pages[page:page+2]:
+            AUDIO.load({c.value: self.clips[c.value] for c in cards if c.is_audio and c.value in self.clips})
+
+    def layout_cards(self):
+        # the column count that gives the biggest CARD_W:CARD_H cards, centred;
+        # every page uses the first page's grid so cards do not jump around
+        ui = self.layout
+        n  = len(self.pages[0]) if self.pages else 0
+        if not n:
+            return
+        gap    = ui.px(GAP)
+        pager  = ui.px(PAGER_H) if len(self.pages) > 1 else 0
+        height = ui.h - pager
+        best = None
+        for cols in range(1, n + 1):
+            rows = -(-n // cols)
+            w = min((ui.w - gap*(cols+1)) / cols, (height - gap*(rows+1)) / rows * CARD_W / CARD_H)
+            if best is None or w > best[0]:
+                best = (w, cols, rows)
+        w, cols, rows = best
+        w = int(min(w, ui.px(CARD_W) * MAX_CARD_SCALE))
+        h = w * CARD_H // CARD_W
+        left = (ui.w - cols*w - (cols-1)*gap) // 2
+        top  = (height - rows*h - (rows-1)*gap) // 2
+        self.grid = (left, top, w, h, gap, cols)
+        font = FONTS.scaled(self.font, h / CARD_H)
+        for i, card in enumerate(self.cards):
+            row, col = divmod(i, cols)
+            card.rect = pygame.Rect(left + col*(w + gap), top + row*(h + gap), w, h)
+            card.render((w, h), font)
+
+    def card_at(self, pos):
+        # O(1): which grid cell `pos` is in, and whether it is on a card
+        left, top, w, h, gap, cols = self.grid
+        col, dx = divmod(pos[0] - left, w + gap)
+        row, dy = divmod(pos[1] - top, h + gap)
+        if col < 0 or row < 0 or col >= cols or dx >= w or dy >= h:
+            return None
+        i = row*cols + col
+        return self.cards[i] if i < len(self.cards) else None
+
+    def turn(self, step):
+        page = (self.page + step) % len(self.pages)
+        if page != self.page:
+            self.show_page(page)
+
+    def resized(self):
+        self.layout_cards()
+
+    def exit(self):
+        PREFETCH.cancel()
+        AUDIO.stop()
+        ATTEMPTS.flush()
+
+    def accuracy(self):
+        return self.matched / len(self.words) if self.words else 0
+
+    def quit(self):
+        self.engine.pop(self.accuracy())
+
+    def handle(self, e):
+        if self.flash is not None and e.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
+            self.timers.finish()              # input ends the flash early
+            if self.engine.top is not self:
+                return
+        if e.type == pygame.KEYDOWN and e.key in PAGE_KEYS and self.pages:
+            self.turn(PAGE_KEYS[e.key])
+            return
+        if e.type != pygame.MOUSEBUTTONDOWN or self.grid is None:
+            return
+        clicked_at = time.perf_counter()
+        c = self.card_at(e.pos)
+        if c is not None and not c.matched:
+            self.click(c, clicked_at)
+
+    def click(self, c, clicked_at):
+        if c.is_audio:
+            self.selected_audio = c
+            self.heard_at = clicked_at
+            AUDIO.play(self.clips[c.value], clicked_at)
+        elif self.selected_audio:
+            target = self.selected_audio.value
+            ATTEMPTS.record("memory", self.level, target, target, c.value,
+                            c.value == target, (clicked_at - self.heard_at) * 1000)
+            if c.value == self.selected_audio.value:
+                c.matched = self.selected_audio.matched = True
+                self.matched += 1
+                self.show_flash("Matched!", (0, 200, 0), then=self.flashed)
+            else:
+                self.show_flash("Try Again", (200, 50, 50))
+            self.selected_audio = None
+
+    def show_flash(self, message, color, then=None):
+        # tint the board and show `message`; not modal, input stays live
+        self.flash = (message, color, self.timers.tween(FLASH_MS, 255, 0, ease_in))
+        self.timers.after(FLASH_MS, lambda: self.end_flash(then))
+
+    def end_flash(self, then):
+        self.flash = None
+        if then:
+            then()
+
+    def flashed(self):
+        if self.matched == len(self.words):
+            self.engine.push(PopupScene(self.font, [
+                "Great job! All matches completed.",
+                "Press SPACE to play again"
+            ]), then=lambda _: self.engine.pop(self.accuracy()))
+        elif all(c.matched for c in self.cards):
+            # page cleared: on to the next one with pairs left
+            for step in range(1, len(self.pages)):
+                page = (self.page + step) % len(self.pages)
+                if not all(c.matched for c in self.pages[page]):
+                    self.show_page(page)
+                    break
+
+    def draw(self, canvas):
+        for c in self.cards:
+            c.draw(canvas)
+        if len(self.pages) > 1:
+            ui   = self.layout
+            text = f"Page {self.page + 1} of {len(self.pages)}  (LEFT / RIGHT to turn)"
+            pager = render_text(ui.font(self.font), text, TEXT_COLOR)
+            canvas.blit("pager", pager, center=(ui.w // 2, ui.h - ui.px(PAGER_H) // 2))
+        if self.flash is not None:
+            message, color, fade = self.flash
+            canvas.blit("flash_tint", overlay(self.size, FLASH_ALPHA, color))
+            text = render_text(self.layout.font(self.font), message, TEXT_COLOR)
+            canvas.blit("flash", faded(text, fade.value()), center=self.screen.get_rect().center)
+
+
 def run_memory_match(screen, font):
-    pygame.mixer.init()
-    clock = pygame.time.Clock()
-    sw, sh = screen.get_size()
-    bg     = pygame.image.load(BG_IMAGE)
-    bg     = pygame.transform.scale(bg, (sw, sh))
-
-    level = ask_grade_level(screen, font)
-    if not level: return 0
-
-    instructions = [
-        "Match each sound with its written word.",
-        "Click a sound card to hear it.",
-        "Then click the word that matches.",
-        "Make all matches to win!"
-    ]
-    popup(screen, font, instructions)
-
-    sound_dir = os.path.join(SOUND_BASE_DIR, level)
-    sound_files = [f for f in os.listdir(sound_dir) if f.endswith(".mp3")]
-    words       = [os.path.splitext(f)[0] for f in sound_files]
-    if not words: return 0
-    random.shuffle(words)
-
-    all_card_data = [(w, True) for w in words] + [(w, False) for w in words]
-    random.shuffle(all_card_data)
-
-    cols = min(6, len(all_card_data))
-    rows = (len(all_card_data) + cols - 1) // cols
-
-    cards_all = []
-    for i, (val, is_audio) in enumerate(all_card_data):
-        row, col = divmod(i, cols)
-        x = GAP + col * (CARD_W + GAP)
-        y = GAP + row * (CARD_H + GAP)
-        rect = pygame.Rect(x, y, CARD_W, CARD_H)
-        cards_all.append(Card(rect, val, is_audio))
-
-    matched = 0
-    selected_audio = None
-
-    while matched < len(words):
-        for e in pygame.event.get():
-            if e.type == pygame.QUIT:
-                return matched / len(words)
-            if e.type == pygame.MOUSEBUTTONDOWN:
-                pos = pygame.mouse.get_pos()
-                for c in cards_all:
-                    if c.rect.collidepoint(pos) and not c.matched:
-                        if c.is_audio:
-                            selected_audio = c
-                            if pygame.mixer.music.get_busy():
-                                pygame.mixer.music.stop()
-                            mp3 = os.path.join(sound_dir, f"{c.value}.mp3")
-                            pygame.mixer.music.load(mp3)
-                            pygame.mixer.music.play()
-                        elif selected_audio:
-                            if c.value == selected_audio.value:
-                                c.matched = selected_audio.matched = True
-                                matched += 1
-                                flash_message(screen, font, "Matched!", (0, 200, 0))
-                            else:
-                                flash_message(screen, font, "Try Again", (200, 50, 50))
-                            selected_audio = None
-
-        screen.blit(bg, (0, 0))
-        for c in cards_all:
-            c.draw(screen, font)
-        pygame.display.flip()
-        clock.tick(30)
-
-    popup(screen, font, [
-        "Great job! All matches completed.",
-        "Press SPACE to play again"
-    ])
-    return matched / len(words)
+    return Engine(screen).run(MemoryMatchScene(font))
 
 # ─── MAIN ───────────────────────────────────────────────────────────────
 if __name__ == "__main__":
     pygame.init()
-    screen = pygame.display.set_mode((1000, 600))
+    screen = pygame.display.set_mode((1000, 600), pygame.RESIZABLE)
     pygame.display.set_caption("Audio Match Game")
     font = pygame.font.SysFont(None, 48)
     run_memory_match(screen, font)
@@ -0,0 +1,92 @@
+import threading
+import time
+
+# ─── CONFIG ─────────────────────────────────────────────────────────────
+COALESCE_MS = 250    # gather writes this long before hitting the disk
+RETRY_MS    = 2000   # back-off after a failed flush (e.g. share offline)
+
+
+# ─── WRITE-BEHIND ───────────────────────────────────────────────────────
+class WriteBehind:
+    """Score writes queued on the UI thread, flushed by a background thread.
+
+    Repeated writes to the same (student, game) are coalesced; each flush is
+    one store transaction, so a batch lands completely or not at all.
+    """
+
+    def __init__(self, store, coalesce_ms=COALESCE_MS):
+        self.store     = store
+        self.coalesce  = coalesce_ms / 1000
+        self.errors    = 0
+        self._pending  = {}     # username -> {game: accuracy}
+        self._writing  = {}     # the batch the worker is writing now
+        self._closed   = False
+        self._cond     = threading.Condition()
+        self._thread   = threading.Thread(target=self._work, name="write-behind", daemon=True)
+        self._thread.start()
+
+    def set_score(self, username, game, accuracy):
+        with self._cond:
+            self._pending.setdefault(username, {})[game] = accuracy
+            self._cond.notify_all()
+
+    def flush(self, timeout=None):
+        # block until everything queued so far is on disk
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._cond.notify_all()
+            while self._pending or self._writing:
+                left = None if deadline is None else deadline - time.monotonic()
+                if left is not None and left <= 0:
+                    return False
+                self._cond.wait(left)
+        return True
+
+    def unsaved(self):
+        # scores queued or being written that are not on disk yet
+        with self._cond:
+            keys = {(u, g) for batch in (self._pending, self._writing)
+                    for u, scores in batch.items() for g in scores}
+            return len(keys)
+
+    def close(self, timeout=None):
+        # False if scores were still unsaved when `timeout` ran out; the
+        # worker makes one last attempt and then gives up on them
+        flushed = self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        return flushed
+
+    def _work(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if self._closed and not self._pending:
+                    break
+            time.sleep(self.coalesce)
+
+            with self._cond:
+                batch, self._pending = self._pending, {}
+                self._writing = batch
+            try:
+                self.store.write_batch(batch)
+                failed = False
+            except Exception:
+                failed = True
+            with self._cond:
+                if failed:
+                    # put the batch back under anything newer and retry
+                    self.errors += 1
+                    for username, scores in batch.items():
+                        self._pending[username] = {**scores, **self._pending.get(username, {})}
+                self._writing = {}
+                self._cond.notify_all()
+                if failed:
+                    if self._closed:
+                        break
+                    # close() cuts the back-off short for a last attempt
+                    self._cond.wait_for(lambda: self._closed, RETRY_MS / 1000)
+        self.store.close()
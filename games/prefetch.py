@@ -0,0 +1,76 @@
+import queue
+import threading
+
+# ─── CONFIG ─────────────────────────────────────────────────────────────
+MAX_PENDING = 32   # jobs beyond this are dropped and loaded on demand
+
+
+# ─── PREFETCHER ─────────────────────────────────────────────────────────
+class Prefetcher:
+    """Background worker that decodes upcoming assets ahead of use.
+
+    submit() queues `fn(*args)` under a key; take() hands the result over
+    (waiting if the job is still running). cancel() drops everything queued
+    or finished, e.g. when a game is left early.
+    """
+
+    def __init__(self, max_pending=MAX_PENDING):
+        self._jobs       = queue.Queue(max_pending)
+        self._cond       = threading.Condition()
+        self._pending    = set()
+        self._done       = {}
+        self._generation = 0
+        self._thread     = None
+
+    def submit(self, key, fn, *args):
+        with self._cond:
+            if key in self._pending or key in self._done:
+                return True
+            try:
+                self._jobs.put_nowait((self._generation, key, fn, args))
+            except queue.Full:
+                return False
+            self._pending.add(key)
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._work, name="prefetch", daemon=True)
+            self._thread.start()
+        return True
+
+    def take(self, key):
+        with self._cond:
+            while key in self._pending:
+                self._cond.wait()
+            return self._done.pop(key, None)
+
+    def cancel(self):
+        # the queue is drained under the lock, so a submit() cannot slip a
+        # job in between and have it thrown away while still pending
+        with self._cond:
+            self._generation += 1
+            self._pending.clear()
+            self._done.clear()
+            while True:
+                try:
+                    self._jobs.get_nowait()
+                except queue.Empty:
+                    break
+            self._cond.notify_all()
+
+    def _work(self):
+        while True:
+            generation, key, fn, args = self._jobs.get()
+            if generation != self._generation:
+                continue
+            try:
+                result = fn(*args)
+            except Exception:
+                result = None   # the caller falls back to loading it itself
+            with self._cond:
+                if generation == self._generation:
+                    self._pending.discard(key)
+                    if result is not None:
+                        self._done[key] = result
+                    self._cond.notify_all()
+
+
+PREFETCH = Prefetcher()
@@ -0,0 +1,202 @@
+import atexit
+import json
+import os
+import sys
+import time
+from collections import deque
+import pygame
+from games.assets import ASSETS
+from games.audio import AUDIO
+from games.text import TEXT
+from games.textinput import latency_stats
+
+# ─── CONFIG ─────────────────────────────────────────────────────────────
+TOGGLE_KEY   = pygame.K_F3
+TRACE_ENV    = "LUCKY_LETTERS_TRACE"    # set to a path to record a Chrome trace
+STARTUP_ENV  = "LUCKY_LETTERS_STARTUP"  # set to print startup milestones
+HISTORY      = 240                      # frames kept for the overlay stats
+PANEL_MS     = 250                      # overlay text refresh interval
+COUNTER_MS   = 500                      # cache/memory counters in the trace
+MAX_TRACE_EVENTS = 1_000_000
+PHASES       = ("wait", "events", "update", "draw", "flip")
+PANEL_BG     = (0, 0, 0, 190)
+PANEL_FG     = (120, 255, 120)
+
+
+def _mb(nbytes):
+    return nbytes / (1024 * 1024)
+
+
+# ─── FRAME PROFILER ─────────────────────────────────────────────────────
+class FrameProfiler:
+    """Per-frame phase timings for Engine.run, an F3 overlay and a trace.
+
+    The engine brackets each loop phase with phase(); "wait" is time spent
+    blocked for input, the rest is work. The overlay is one canvas item, so
+    it rides the normal dirty-rect path on every screen. With a trace path
+    set, every phase is also recorded as a Chrome trace event (open it in
+    chrome://tracing or Perfetto).
+    """
+
+    def __init__(self):
+        self.visible    = False
+        self.frames     = deque(maxlen=HISTORY)    # (start, end, {phase: ms})
+        self.trace      = None
+        self.trace_path = None
+        self._origin    = time.perf_counter()
+        self._start     = self._origin
+        self._phases    = {}
+        self._font      = None
+        self._panel     = None
+        self._panel_at  = 0.0
+        self._counter_at = 0.0
+        self.startup    = {}                       # milestone -> ms since launch
+        self._launched  = None
+        self._on_startup = []
+
+    def toggle(self):
+        self.visible = not self.visible
+        self._panel  = None
+
+    # ─── startup ─────────────────────────────────────────────────────
+    def begin_startup(self, launched):
+        # `launched` is a perf_counter() taken before the heavy imports
+        self._launched = launched
+        self.startup   = {}
+
+    def mark(self, name):
+        if self._launched is None:
+            return
+        now = time.perf_counter()
+        self.startup[name] = round((now - self._launched) * 1000, 2)
+        if self.trace is not None and len(self.trace) < MAX_TRACE_EVENTS:
+            self.trace.append({"name": name, "ph": "i", "s": "g", "pid": 1, "tid": 1, "ts": self._us(now)})
+
+    def on_startup(self, cb):
+        # cb({milestone: ms}) once the first frame is on screen
+        self._on_startup.append(cb)
+
+    # ─── timing ──────────────────────────────────────────────────────
+    def frame_start(self):
+        self._phases = {}
+        self._start  = time.perf_counter()
+        return self._start
+
+    def phase(self, name, since):
+        # charge the time since `since` to `name`; returns now for chaining
+        now = time.perf_counter()
+        self._phases[name] = self._phases.get(name, 0.0) + (now - since) * 1000
+        if self.trace is not None:
+            self._event(name, since, now)
+        return now
+
+    def frame_end(self):
+        now = time.perf_counter()
+        self.frames.append((self._start, now, self._phases))
+        if self._launched is not None and "first_frame" not in self.startup:
+            self.mark("first_frame")
+            for cb in self._on_startup:
+                cb(dict(self.startup))
+        if self.trace is not None:
+            self._event("frame", self._start, now)
+            if now - self._counter_at >= COUNTER_MS / 1000:
+                self._counter_at = now
+                self._counters(now)
+
+    def stats(self):
+        if len(self.frames) < 2:
+            return None
+        frames  = list(self.frames)
+        elapsed = frames[-1][1] - frames[0][0]
+        work    = sorted((end - start) * 1000 - ph.get("wait", 0.0) for start, end, ph in frames)
+        pick    = lambda q: work[min(len(work) - 1, int(len(work) * q))]
+        return {
+            "fps":    (len(frames) - 1) / elapsed if elapsed > 0 else 0.0,
+            "p50_ms": pick(0.50),
+            "p95_ms": pick(0.95),
+            "p99_ms": pick(0.99),
+            "phases": {p: sum(ph.get(p, 0.0) for _, _, ph in frames) / len(frames) for p in PHASES},
+        }
+
+    # ─── overlay ─────────────────────────────────────────────────────
+    def draw(self, canvas):
+        if not self.visible:
+            return
+        now = time.perf_counter()
+        if self._panel is None or now - self._panel_at >= PANEL_MS / 1000:
+            self._panel, self._panel_at = self._render(), now
+        canvas.blit("profiler", self._panel, topright=(canvas.screen.get_width() - 8, 8))
+
+    def _render(self):
+        if self._font is None:
+            self._font = pygame.font.Font(None, 20)
+        s = self.stats()
+        images, text = ASSETS.stats(), TEXT.stats()
+        screen = pygame.display.get_surface()
+        screen_bytes = screen.get_pitch() * screen.get_height() if screen else 0
+        lines = ["collecting..."] if s is None else [
+            f"FPS {s['fps']:5.1f}   frame p50 {s['p50_ms']:.2f}  p95 {s['p95_ms']:.2f}  p99 {s['p99_ms']:.2f} ms",
+            "  ".join(f"{p} {s['phases'][p]:.2f}" for p in PHASES) + " ms",
+        ]
+        lines += [
+            f"images {images['hit_rate']:.0%} hit  {images['entries']} surf  {_mb(images['bytes']):.1f} MB",
+            f"text   {text['hit_rate']:.0%} hit  {text['entries']} surf  {_mb(text['bytes']):.1f} MB",
+            f"surfaces {_mb(images['bytes'] + text['bytes'] + screen_bytes):.1f} MB",
+        ]
+        keys = latency_stats()
+        if keys["keys"]:
+            lines.append(f"key->screen p50 {keys['p50_ms']:.2f}  p95 {keys['p95_ms']:.2f} ms ({keys['keys']} keys)")
+        sound = AUDIO.stats()
+        if sound["plays"]:
+            lines.append(f"click->play p50 {sound['p50_ms']:.2f}  p95 {sound['p95_ms']:.2f} ms"
+                         f" + mixer {sound['buffer_ms']:.1f} ms ({sound['plays']} plays)")
+        if self.trace is not None:
+            lines.append(f"trace -> {self.trace_path} ({len(self.trace)} events)")
+        rendered = [self._font.render(line, True, PANEL_FG) for line in lines]
+        w = max(r.get_width() for r in rendered) + 12
+        h = sum(r.get_height() for r in rendered) + 10
+        panel = pygame.Surface((w, h), pygame.SRCALPHA)
+        panel.fill(PANEL_BG)
+        y = 5
+        for r in rendered:
+            panel.blit(r, (6, y))
+            y += r.get_height()
+        return panel
+
+    # ─── chrome trace ────────────────────────────────────────────────
+    def start_trace(self, path):
+        if self.trace is None:
+            atexit.register(self.save_trace)
+        self.trace, self.trace_path = [], path
+
+    def save_trace(self):
+        if self.trace is None:
+            return
+        tmp = self.trace_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump({"traceEvents": self.trace, "displayTimeUnit": "ms"}, f)
+        os.replace(tmp, self.trace_path)
+
+    def _us(self, t):
+        return round((t - self._origin) * 1e6, 1)
+
+    def _event(self, name, start, end):
+        if len(self.trace) < MAX_TRACE_EVENTS:
+            self.trace.append({"name": name, "ph": "X", "pid": 1, "tid": 1,
+                               "ts": self._us(start), "dur": round((end - start) * 1e6, 1)})
+
+    def _counters(self, now):
+        images, text = ASSETS.stats(), TEXT.stats()
+        if len(self.trace) < MAX_TRACE_EVENTS:
+            self.trace.append({"name": "caches", "ph": "C", "pid": 1, "ts": self._us(now), "args": {
+                "image_hit_rate": round(images["hit_rate"], 3),
+                "text_hit_rate":  round(text["hit_rate"], 3),
+                "surface_mb":     round(_mb(images["bytes"] + text["bytes"]), 2),
+            }})
+
+
+PROFILER = FrameProfiler()
+if os.environ.get(TRACE_ENV):
+    PROFILER.start_trace(os.environ[TRACE_ENV])
+if os.environ.get(STARTUP_ENV):
+    PROFILER.on_startup(lambda marks: print("startup", json.dumps(marks), file=sys.stderr))
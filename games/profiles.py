@@ -0,0 +1,169 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+# ─── CONFIG ─────────────────────────────────────────────────────────────
+DB_FILE     = "profiles.db"
+LEGACY_FILE = "profiles.json"
+GAMES       = ("treasure", "unjumble", "add_letters", "memory")
+BUSY_MS     = 10000     # how long a writer waits for another process' lock
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS profiles (
+    key              TEXT PRIMARY KEY,      -- case-folded username
+    name             TEXT NOT NULL,         -- as the student typed it
+    levels_completed TEXT NOT NULL DEFAULT '[]',
+    {", ".join(f"{g} REAL NOT NULL DEFAULT 0" for g in GAMES)}
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def default_scores():
+    return {g: 0.0 for g in GAMES}
+
+def user_key(username):
+    return username.strip().casefold()
+
+
+# ─── PROFILE STORE ──────────────────────────────────────────────────────
+class ProfileStore:
+    """Student profiles in SQLite (WAL), one row per student.
+
+    Safe for several game instances sharing the file: every write is a
+    short IMMEDIATE transaction touching only that student's row. On first
+    open the legacy profiles.json is imported once and normalized.
+    """
+
+    def __init__(self, path=DB_FILE, legacy=LEGACY_FILE):
+        self.path   = path
+        self._local = threading.local()    # sqlite connections are per thread
+        self.db().executescript(SCHEMA)
+        if legacy and os.path.exists(legacy):
+            self.migrate(legacy)
+
+    def db(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=BUSY_MS / 1000, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={BUSY_MS}")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def transaction(self):
+        db = self.db()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            yield db
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        db.execute("COMMIT")
+
+    # ─── reads ───────────────────────────────────────────────────────
+    def get(self, username):
+        row = self.db().execute(
+            f"SELECT name, levels_completed, {', '.join(GAMES)} FROM profiles WHERE key = ?",
+            (user_key(username),)).fetchone()
+        return _profile(row) if row else None
+
+    def all(self):
+        rows = self.db().execute(
+            f"SELECT name, levels_completed, {', '.join(GAMES)} FROM profiles ORDER BY key")
+        return {row[0]: _profile(row) for row in rows}
+
+    # ─── writes ──────────────────────────────────────────────────────
+    def get_or_create(self, username):
+        with self.transaction() as db:
+            db.execute("INSERT OR IGNORE INTO profiles (key, name) VALUES (?, ?)",
+                       (user_key(username), username.strip()))
+        return self.get(username)
+
+    def set_score(self, username, game, accuracy):
+        self.set_scores(username, {game: accuracy})
+
+    def set_scores(self, username, scores):
+        self.write_batch({username: scores})
+
+    def write_batch(self, batch):
+        # {username: {game: accuracy}} applied in a single transaction
+        with self.transaction() as db:
+            for username, scores in batch.items():
+                _upsert(db, username, scores)
+
+    # ─── legacy import ───────────────────────────────────────────────
+    def migrate(self, legacy):
+        with self.transaction() as db:
+            if db.execute("SELECT 1 FROM meta WHERE key = 'migrated_json'").fetchone():
+                return
+            for name, profile in normalize(load_legacy(legacy)).items():
+                db.execute(
+                    f"INSERT OR IGNORE INTO profiles (key, name, levels_completed, {', '.join(GAMES)}) "
+                    f"VALUES (?, ?, ?, {', '.join('?' for _ in GAMES)})",
+                    (user_key(name), name, json.dumps(profile["levels_completed"]),
+                     *[profile["scores"][g] for g in GAMES]))
+            db.execute("INSERT INTO meta (key, value) VALUES ('migrated_json', ?)",
+                       (time.strftime("%Y-%m-%dT%H:%M:%S"),))
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+def _upsert(db, username, scores):
+    # insert-or-update just these columns for one student
+    cols = [g for g in scores if g in GAMES]
+    if not cols:
+        return
+    db.execute(
+        f"INSERT INTO profiles (key, name, {', '.join(cols)}) "
+        f"VALUES (?, ?, {', '.join('?' for _ in cols)}) "
+        f"ON CONFLICT(key) DO UPDATE SET {', '.join(f'{c} = excluded.{c}' for c in cols)}",
+        (user_key(username), username.strip(), *[float(scores[c] or 0.0) for c in cols]))
+
+def _profile(row):
+    return {
+        "name":             row[0],
+        "levels_completed": json.loads(row[1]),
+        "scores":           dict(zip(GAMES, row[2:])),
+    }
+
+
+# ─── LEGACY JSON ────────────────────────────────────────────────────────
+def load_legacy(path=LEGACY_FILE):
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r") as f:
+        return json.load(f)
+
+def normalize(profiles):
+    # fill missing/null scores with 0.0 and fold case-duplicates (meg/Meg)
+    # into one record keeping the best score per game
+    merged = {}
+    for name, record in profiles.items():
+        record = record or {}
+        scores = default_scores()
+        for g, v in (record.get("scores") or {}).items():
+            if g in scores and isinstance(v, (int, float)):
+                scores[g] = float(v)
+        levels = list(record.get("levels_completed") or [])
+
+        key = user_key(name)
+        if key not in merged:
+            merged[key] = {"name": name.strip(), "levels_completed": levels, "scores": scores}
+            continue
+        keep = merged[key]
+        keep["scores"] = {g: max(keep["scores"][g], scores[g]) for g in GAMES}
+        keep["levels_completed"] += [l for l in levels if l not in keep["levels_completed"]]
+    return {p["name"]: p for p in merged.values()}
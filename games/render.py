@@ -0,0 +1,132 @@
+import pygame
+from games.assets import ASSETS
+
+# ─── CONFIG ─────────────────────────────────────────────────────────────
+DIRTY_RECTS = True   # False -> redraw everything and flip() every frame
+FADE_STEPS  = 16     # alpha levels a fade is quantised to (and cached at)
+
+
+# ─── CANVAS ─────────────────────────────────────────────────────────────
+class Canvas:
+    """Retained-mode view of one screen.
+
+    Each frame the loop declares what should be visible with blit()/rect();
+    present() diffs that against the previous frame and only repaints the
+    rects that changed. A frame with no changes touches nothing.
+    """
+
+    def __init__(self, screen, background):
+        self.screen     = screen
+        self.size       = screen.get_size()      # the size this view was laid out for
+        self.background = background
+        self._shown     = {}     # key -> item on screen now
+        self._frame     = {}     # key -> item declared for the next present()
+        self._full      = True
+        self._presented = []     # one-shot callbacks run after the next present()
+
+    def resize(self, screen, background):
+        # the window changed size: new target and background, full repaint
+        self.screen, self.size = screen, screen.get_size()
+        self.background = background
+        self._shown = {}
+        self._full  = True
+
+    def invalidate(self):
+        # something else drew over the screen (nested popup, flash, ...)
+        self._full = True
+
+    def blit(self, key, surf, **anchor):
+        rect = surf.get_rect(**anchor) if anchor else surf.get_rect()
+        self._frame[key] = ("blit", surf, rect)
+        return rect
+
+    def after_present(self, fn):
+        # fn() once the next present() has put this frame on screen
+        if fn not in self._presented:
+            self._presented.append(fn)
+
+    def rect(self, key, color, rect, width=0):
+        self._frame[key] = ("rect", tuple(color), pygame.Rect(rect), width)
+
+    def present(self):
+        frame, self._frame = self._frame, {}
+        if self._full or not DIRTY_RECTS:
+            self.screen.blit(self.background, (0, 0))
+            for item in frame.values():
+                self._draw(item)
+            pygame.display.flip()
+        else:
+            dirty = []
+            for key in self._shown.keys() | frame.keys():
+                old, new = self._shown.get(key), frame.get(key)
+                if old != new:
+                    if old: dirty.append(_bounds(old))
+                    if new: dirty.append(_bounds(new))
+            if dirty:
+                self._repaint(dirty, frame)
+                pygame.display.update(dirty)
+        self._shown = frame
+        self._full  = False
+        if self._presented:
+            callbacks, self._presented = self._presented, []
+            for fn in callbacks:
+                fn()
+
+    def _repaint(self, dirty, frame):
+        for area in dirty:
+            self.screen.set_clip(area)
+            self.screen.blit(self.background, area, area)
+            for item in frame.values():
+                if area.colliderect(_bounds(item)):
+                    self._draw(item)
+        self.screen.set_clip(None)
+
+    def _draw(self, item):
+        if item[0] == "blit":
+            self.screen.blit(item[1], item[2])
+        else:
+            pygame.draw.rect(self.screen, item[1], item[2], item[3])
+
+
+def _bounds(item):
+    return item[2]
+
+
+# ─── STATIC LAYERS ──────────────────────────────────────────────────────
+def dimmed(bg, alpha=180, color=(0, 0, 0)):
+    # bg + translucent overlay, blended once and cached instead of per frame
+    key  = ("dimmed", bg, alpha, color)
+    surf = ASSETS.get(key)
+    if surf is None:
+        surf = ASSETS.put(key, tinted(bg, alpha, color))
+    return surf
+
+def tinted(bg, alpha, color):
+    surf = bg.copy()
+    overlay = pygame.Surface(surf.get_size(), pygame.SRCALPHA)
+    overlay.fill((*color, alpha))
+    surf.blit(overlay, (0, 0))
+    return surf
+
+def overlay(size, alpha, color):
+    # a translucent full-window wash, made once per size and colour
+    key  = ("overlay", tuple(size), alpha, tuple(color))
+    surf = ASSETS.get(key)
+    if surf is None:
+        surf = pygame.Surface(size, pygame.SRCALPHA)
+        surf.fill((*color, alpha))
+        surf = ASSETS.put(key, surf)
+    return surf
+
+def faded(surf, alpha):
+    # `surf` at `alpha`; a fade reuses FADE_STEPS cached copies
+    level = max(0, min(FADE_STEPS, round(alpha * FADE_STEPS / 255)))
+    if level == FADE_STEPS:
+        return surf
+    key  = ("faded", surf, level)
+    copy = ASSETS.get(key)
+    if copy is None:
+        copy = surf.copy()
+        copy.set_alpha(255 * level // FADE_STEPS)
+        copy = ASSETS.put(key, copy)
+    return copy
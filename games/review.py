@@ -0,0 +1,118 @@
+import heapq
+import itertools
+import random
+import time
+from games.attempts import ATTEMPTS, LEVEL_CODES, LEVEL_NAMES, clip
+
+# ─── CONFIG ─────────────────────────────────────────────────────────────
+SESSION_ROUNDS = 10
+# Leitner boxes: seconds until a word in box i is due again
+BOX_INTERVALS  = [0, 10 * 60, 24 * 3600, 3 * 24 * 3600, 7 * 24 * 3600, 21 * 24 * 3600]
+LEVEL_BY_NAME  = {v: k for k, v in LEVEL_NAMES.items()}
+
+
+def word_key(word):
+    return word.strip().casefold()
+
+def deck_key(word):
+    # clipped like the log, so a long word matches its own replayed history
+    return word_key(clip(word))
+
+
+# ─── LEITNER DECK ───────────────────────────────────────────────────────
+class Deck:
+    """One student's words for one (game, level), as a due-time heap.
+
+    A correct answer moves a word up a box (longer interval), a miss sends
+    it back to box 0 (due immediately). Misses are a tier of their own, so
+    they come up before anything else whenever they were answered. Words
+    never tried are due when first seen, so they come up after misses but
+    before learned words.
+    """
+
+    def __init__(self):
+        self.box   = {}                 # word -> Leitner box
+        self.due   = {}                 # word -> (tier, due time, seq)
+        self.heap  = []                 # (tier, due time, seq, word), stale entries skipped
+        self._seq  = itertools.count()
+
+    def schedule(self, word, due, tier=1):
+        entry = (tier, due, next(self._seq))
+        self.due[word] = entry
+        heapq.heappush(self.heap, (*entry, word))
+
+    def observe(self, word, correct, ts):
+        box = min(self.box.get(word, 0) + 1, len(BOX_INTERVALS) - 1) if correct else 0
+        self.box[word] = box
+        self.schedule(word, ts + BOX_INTERVALS[box], tier=1 if correct else 0)
+
+    def add(self, words, now):
+        # new words queue behind misses and overdue reviews
+        for word in words:
+            if word not in self.due:
+                self.schedule(word, now)
+
+    def take(self, n, allowed):
+        # the n earliest-due words in `allowed`; O(n log size)
+        picked, skipped = [], []
+        while self.heap and len(picked) < n:
+            entry = heapq.heappop(self.heap)
+            word  = entry[-1]
+            if self.due.get(word) != entry[:-1]:
+                continue                    # superseded by a later answer
+            (picked if word in allowed else skipped).append(entry)
+        for entry in picked + skipped:
+            heapq.heappush(self.heap, entry)
+        return [entry[-1] for entry in picked]
+
+
+# ─── SCHEDULER ──────────────────────────────────────────────────────────
+class ReviewScheduler:
+    """Spaced-repetition round selection shared by all four games.
+
+    Decks are built per student from the attempt log the first time the
+    student plays, then kept current from ATTEMPTS.on_record.
+    """
+
+    def __init__(self, log=ATTEMPTS):
+        self.log    = log
+        self.decks  = {}        # (student, game, level code) -> Deck
+        self.loaded = set()     # students whose history has been replayed
+        log.on_record(self._recorded)
+
+    def select(self, game, level, items, n=SESSION_ROUNDS, key=lambda item: item.word):
+        # the session's rounds: due/missed/new words first, in random order
+        student = self.log.student
+        if student is None:
+            return random.sample(items, min(n, len(items)))     # guest: no history
+        self._load(student)
+        items = random.sample(items, len(items))     # new words in random order
+        by_word = {deck_key(key(item)): item for item in items}
+        deck = self._deck(student, game, LEVEL_CODES.get(level, 0))
+        deck.add(by_word, time.time())
+        picked = [by_word[w] for w in deck.take(n, by_word)]
+        random.shuffle(picked)
+        return picked
+
+    def _deck(self, student, game, level):
+        k = (word_key(student), game, level)
+        deck = self.decks.get(k)
+        if deck is None:
+            deck = self.decks[k] = Deck()
+        return deck
+
+    def _load(self, student):
+        if word_key(student) in self.loaded:
+            return
+        self.loaded.add(word_key(student))
+        self.log.flush()
+        for a in self.log.scan(student):
+            self._deck(student, a.game, LEVEL_BY_NAME.get(a.level, 0)).observe(
+                deck_key(a.word), a.correct, a.ts)
+
+    def _recorded(self, student, game, level, word, correct, ts):
+        if word_key(student) in self.loaded:
+            self._deck(student, game, LEVEL_CODES.get(level, 0)).observe(deck_key(word), correct, ts)
+
+
+REVIEW = ReviewScheduler()
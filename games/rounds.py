@@ -0,0 +1,166 @@
+import time
+import pygame
+from games.attempts import ATTEMPTS
+from games.engine import Scene
+from games.scenes import LevelSelectScene, PopupScene
+from games.prefetch import PREFETCH
+from games.render import faded
+from games.text import render_text
+from games.textinput import TextInput, letters
+from games.tweens import ease_in
+from games.typeset import READING
+
+# ─── CONFIG ─────────────────────────────────────────────────────────────
+FEEDBACK_MS    = 800      # feedback shown before the next round; typing skips it
+MAX_ANSWER     = 32
+PREFETCH_AHEAD = 3       # rounds decoded in the background ahead of play
+CORRECT_COLOR  = (0, 200, 0)
+WRONG_COLOR    = (200, 0, 0)
+
+
+# ─── ROUND-BASED GAME ───────────────────────────────────────────────────
+class RoundGame(Scene):
+    """Level select, then typed-answer rounds, then a result popup.
+
+    Subclasses fill in make_rounds/setup_round/validator/check/draw_round;
+    the scene pops with the accuracy in [0, 1].
+    """
+
+    name   = ""                           # score slot / attempt-log game
+    levels = {"1": "K", "2": "Spelling"}
+    style  = READING                      # spacing for the words being read/typed
+
+    def __init__(self, font):
+        super().__init__()
+        self.font     = font
+        self.level    = None
+        self.rounds   = []
+        self.index    = 0
+        self.correct  = 0
+        self.input    = TextInput()
+        self.feedback = ""
+        self.color    = CORRECT_COLOR
+        self.fade     = None               # feedback alpha tween
+        self.advance  = None               # timer that moves to the next round
+
+    # ─── hooks ───────────────────────────────────────────────────────
+    def make_rounds(self, level):
+        return []
+
+    def setup_round(self, item):
+        pass
+
+    def prefetch_round(self, item):
+        # queue this round's assets on the prefetch worker
+        pass
+
+    def validator(self):
+        # games.textinput validator for this round's answer box
+        return letters(MAX_ANSWER)
+
+    def check(self, typed):
+        # (correct, feedback) for an ENTER press, or None to ignore it
+        return None
+
+    def target(self):
+        # (target word, expected answer) for the attempt log
+        return "", ""
+
+    def draw_round(self, canvas):
+        pass
+
+    def result_lines(self, accuracy):
+        return [
+            f"You got {self.correct}/{len(self.rounds)}.",
+            "You passed!" if accuracy >= 0.8 else "Try again next time.",
+        ]
+
+    @property
+    def typed(self):
+        return self.input.text
+
+    # ─── flow ────────────────────────────────────────────────────────
+    def enter(self):
+        self.engine.push(LevelSelectScene(self.font, self.levels), then=self.start)
+        self.engine.preload(type(self))
+
+    def start(self, level):
+        if level is None:
+            self.engine.pop(0)
+            return
+        self.level  = level
+        self.rounds = self.make_rounds(level)
+        if not self.rounds:
+            self.engine.pop(0)
+            return
+        self.input.focus()
+        self.begin_round()
+
+    def begin_round(self):
+        self.input.clear()
+        self.feedback = ""
+        self.fade     = None
+        self.setup_round(self.rounds[self.index])
+        self.input.validator = self.validator()
+        self.shown_at = time.perf_counter()
+        for item in self.rounds[self.index+1 : self.index+1+PREFETCH_AHEAD]:
+            self.prefetch_round(item)
+
+    def exit(self):
+        self.input.blur()
+        PREFETCH.cancel()
+        ATTEMPTS.flush()
+
+    def accuracy(self):
+        return self.correct / len(self.rounds) if self.rounds else 0
+
+    def quit(self):
+        self.engine.pop(self.accuracy())
+
+    def handle(self, e):
+        if self.level is None or e.type not in (pygame.KEYDOWN, pygame.KEYUP,
+                                                pygame.TEXTINPUT, pygame.TEXTEDITING):
+            return
+        enter = e.type == pygame.KEYDOWN and e.key in (pygame.K_RETURN, pygame.K_KP_ENTER)
+        if self.advance is not None and e.type != pygame.KEYUP:
+            # typing ahead ends the feedback; ENTER only does that
+            self.timers.finish()
+            if enter or self.index >= len(self.rounds):
+                return
+        if enter:
+            result = self.check(self.typed)
+            if result is not None:
+                self.answer(*result)
+        else:
+            self.input.handle(e)
+
+    def update(self):
+        self.input.update()
+
+    def answer(self, ok, feedback):
+        rt_ms = (time.perf_counter() - self.shown_at) * 1000
+        ATTEMPTS.record(self.name, self.level, *self.target(), self.typed, ok, rt_ms)
+        self.feedback = feedback
+        self.color    = CORRECT_COLOR if ok else WRONG_COLOR
+        self.correct += ok
+        self.fade     = self.timers.tween(FEEDBACK_MS, 255, 0, ease_in)
+        self.advance  = self.timers.after(FEEDBACK_MS, self.next_round)
+
+    def next_round(self):
+        self.advance = None
+        self.index += 1
+        if self.index < len(self.rounds):
+            self.begin_round()
+        else:
+            accuracy = self.accuracy()
+            self.engine.push(PopupScene(self.font, self.result_lines(accuracy)),
+                             then=lambda _: self.engine.pop(accuracy))
+
+    def feedback_text(self, font, color=None):
+        # the feedback line, fading out until the next round starts
+        surf = render_text(font, self.feedback, color or self.color)
+        return faded(surf, self.fade.value()) if self.fade else surf
+
+    def draw(self, canvas):
+        if self.level is not None and self.index < len(self.rounds):
+            self.draw_round(canvas)
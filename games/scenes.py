@@ -0,0 +1,75 @@
+import pygame
+from games.assets import load_image
+from games.engine import Scene, DEFAULT_BG
+from games.render import dimmed
+from games.text import render_text
+
+# ─── CONFIG ─────────────────────────────────────────────────────────────
+TEXT_COLOR  = (0, 0, 0)
+GRADE_LEVELS = {"1": "K", "2": "Spelling"}
+
+
+# ─── POPUP ──────────────────────────────────────────────────────────────
+class PopupScene(Scene):
+    """Centered lines over the default background; SPACE pops True."""
+
+    def __init__(self, font, lines, color=(255, 255, 255),
+                 prompt="Press SPACE to continue", prompt_color=(200, 200, 200),
+                 dim=180, image=DEFAULT_BG):
+        super().__init__()
+        self.font         = font
+        self.lines        = lines
+        self.color        = color
+        self.prompt       = prompt
+        self.prompt_color = prompt_color
+        self.dim          = dim
+        self.image        = image
+
+    def background(self):
+        bg = load_image(self.image, self.size)
+        return dimmed(bg, self.dim) if self.dim else bg
+
+    def handle(self, e):
+        if e.type == pygame.KEYDOWN and e.key == pygame.K_SPACE:
+            self.engine.pop(True)
+
+    def quit(self):
+        self.engine.pop(False)
+
+    def draw(self, canvas):
+        ui, sw, sh = self.layout, *self.size
+        font    = ui.font(self.font)
+        gap     = ui.px(20)
+        surfs   = [render_text(font, line, self.color) for line in self.lines]
+        total_h = sum(s.get_height() for s in surfs) + gap*(len(surfs)-1)
+        y = (sh - total_h) // 2
+        for i, surf in enumerate(surfs):
+            canvas.blit(("line", i), surf, center=(sw//2, y + surf.get_height()//2))
+            y += surf.get_height() + gap
+        prompt = render_text(font, self.prompt, self.prompt_color)
+        canvas.blit("prompt", prompt, center=ui.at(0.5, 0.85))
+
+
+# ─── LEVEL SELECT ───────────────────────────────────────────────────────
+class LevelSelectScene(Scene):
+    """Shared grade picker; pops the value mapped to the key pressed."""
+
+    def __init__(self, font, choices=GRADE_LEVELS):
+        super().__init__()
+        self.font    = font
+        self.choices = choices
+        self.options = ["1) K–1", "2) Grade 2–3"]
+        self.prompt  = "Choose your level:"
+
+    def handle(self, e):
+        if e.type == pygame.KEYDOWN and e.unicode in self.choices:
+            self.engine.pop(self.choices[e.unicode])
+
+    def draw(self, canvas):
+        ui   = self.layout
+        font = ui.font(self.font)
+        p = render_text(font, self.prompt, TEXT_COLOR)
+        canvas.blit("prompt", p, center=ui.at(0.5, 0.5, dy=-100))
+        for i, line in enumerate(self.options):
+            surf = render_text(font, line, TEXT_COLOR)
+            canvas.blit(("option", i), surf, center=ui.at(0.5, 0.5, dy=i*50))
@@ -0,0 +1,88 @@
+import time
+import pygame
+
+# ─── CONFIG ─────────────────────────────────────────────────────────────
+ACTIVE_FPS       = 30     # while something is animating
+BACKGROUND_FPS   = 5      # animating, but the window is not focused
+IDLE_WAIT_MS     = 1000   # longest block in event.wait() while static
+BACKGROUND_WAIT_MS = 3000
+
+
+# ─── FRAME SCHEDULER ────────────────────────────────────────────────────
+class FrameScheduler:
+    """Paces every screen loop.
+
+    Static screens block in pygame.event.wait() until input arrives, so an
+    idle menu costs no CPU. While something animates (see animate()) the
+    loop runs at a fixed rate instead, and slower when the window is in the
+    background.
+
+    Timers (see games.tweens) call wake() so a static screen still wakes
+    up when one is due. For headless runs a scripted input source can
+    replace the event queue (see games.headless); in fast mode time is
+    virtual, so timers and animations complete instantly.
+    """
+
+    def __init__(self):
+        self.clock       = pygame.time.Clock()
+        self.focused     = True
+        self.script      = None     # object with poll(scheduler) -> events
+        self.fast        = False
+        self.virtual_ms  = 0
+        self._busy_until = 0
+        self._wake_at    = None
+
+    def ticks(self):
+        # ms clock that works without pygame.init() (virtual in fast mode)
+        return self.virtual_ms if self.fast else int(time.perf_counter() * 1000)
+
+    def animate(self, ms):
+        # keep frames coming at a fixed rate for the next `ms` milliseconds
+        self._busy_until = max(self._busy_until, self.ticks() + ms)
+
+    def animating(self):
+        return self.ticks() < self._busy_until
+
+    def wake(self, ms):
+        # make sure the loop runs a frame `ms` from now (a timer is due)
+        now = self.ticks()
+        if self._wake_at is None or self._wake_at <= now or now + ms < self._wake_at:
+            self._wake_at = now + ms
+
+    def busy(self):
+        # animating, or a timer is still to come
+        now = self.ticks()
+        return now < self._busy_until or (self._wake_at is not None and now < self._wake_at)
+
+    def skip_animation(self):
+        # fast mode: jump the virtual clock past animations and the next timer
+        self.virtual_ms = max(self.virtual_ms, self._busy_until, self._wake_at or 0)
+
+    def events(self):
+        if self.script is not None:
+            events = self.script.poll(self)
+        elif self.animating():
+            self.clock.tick(ACTIVE_FPS if self.focused else BACKGROUND_FPS)
+            events = pygame.event.get()
+        else:
+            timeout = IDLE_WAIT_MS if self.focused else BACKGROUND_WAIT_MS
+            if self._wake_at is not None:
+                timeout = min(timeout, self._wake_at - self.ticks())
+            if timeout > 0:
+                first   = pygame.event.wait(timeout)
+                events  = [] if first.type == pygame.NOEVENT else [first]
+                events += pygame.event.get()
+            else:
+                events = pygame.event.get()
+                self._wake_at = None
+            self.clock.tick()
+
+        for e in events:
+            if e.type == pygame.WINDOWFOCUSLOST:
+                self.focused = False
+            elif e.type == pygame.WINDOWFOCUSGAINED:
+                self.focused = True
+        return events
+
+
+SCHEDULER = FrameScheduler()
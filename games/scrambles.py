@@ -0,0 +1,77 @@
+import random
+import zlib
+from bisect import bisect_left
+from collections import namedtuple
+from functools import lru_cache
+
+# ─── CONFIG ─────────────────────────────────────────────────────────────
+POOL_SIZE = 24     # distinct scrambles kept per word
+SHUFFLES  = 64     # seeded shuffles tried per word (bounds the work)
+WINDOW    = 3      # pick randomly among this many closest to the target
+
+# text: the scrambled word; fixed: letters left in place; swaps: adjacent
+# swaps needed to unscramble; difficulty in [0, 1]
+Scramble = namedtuple("Scramble", "text difficulty fixed swaps first_kept")
+
+
+def scrambleable(word):
+    return len(set(word.lower())) > 1
+
+
+def swaps_to_solve(text, word):
+    # adjacent transpositions turning text into word (repeated letters are
+    # matched in order, which gives the minimum)
+    slots = {}
+    for i, ch in enumerate(word):
+        slots.setdefault(ch, []).append(i)
+    seen  = {}
+    order = []
+    for ch in text:
+        k = seen.get(ch, 0)
+        order.append(slots[ch][k])
+        seen[ch] = k + 1
+    return sum(1 for i in range(len(order)) for j in range(i + 1, len(order)) if order[i] > order[j])
+
+
+def score(text, word):
+    n      = len(word)
+    fixed  = sum(a == b for a, b in zip(text, word))
+    swaps  = swaps_to_solve(text, word)
+    first  = text[0] == word[0]
+    difficulty = (0.4 * (1 - fixed / n)
+                  + 0.4 * swaps / (n * (n - 1) / 2)
+                  + 0.2 * (not first))
+    return Scramble(text, round(difficulty, 3), fixed, swaps, first)
+
+
+@lru_cache(maxsize=4096)
+def pool(word):
+    # up to POOL_SIZE scrambles of `word`, all different from it, easiest
+    # first. Deterministic per word and bounded: rotations guarantee at
+    # least one result, seeded shuffles add the rest.
+    if not scrambleable(word):
+        return (Scramble(word, 0.0, len(word), 0, True),)
+    rng   = random.Random(zlib.crc32(word.encode("utf-8")))
+    found = {}
+    candidates = [word[k:] + word[:k] for k in range(1, len(word))]
+    letters = list(word)
+    for _ in range(SHUFFLES):
+        rng.shuffle(letters)
+        candidates.append("".join(letters))
+    for text in candidates:
+        if text.lower() != word.lower() and text not in found:
+            found[text] = score(text, word)
+    ranked = sorted(found.values(), key=lambda s: (s.difficulty, s.text))
+    if len(ranked) > POOL_SIZE:
+        # keep an even spread over the difficulty range
+        step   = (len(ranked) - 1) / (POOL_SIZE - 1)
+        ranked = [ranked[round(i * step)] for i in range(POOL_SIZE)]
+    return tuple(ranked)
+
+
+def pick(word, target=0.5, rng=random):
+    # a scramble whose difficulty is close to `target`
+    scrambles = pool(word)
+    i  = bisect_left([s.difficulty for s in scrambles], target)
+    lo = max(0, min(i - WINDOW // 2, len(scrambles) - WINDOW))
+    return rng.choice(scrambles[lo:lo + WINDOW])
@@ -0,0 +1,68 @@
+import pygame
+from games.assets import SurfaceCache
+from games.typeset import typeset
+
+# ─── CONFIG ─────────────────────────────────────────────────────────────
+MAX_TEXT_BYTES = 16 * 1024 * 1024
+MIN_FONT_PX    = 10
+
+
+# ─── TEXT CACHE ─────────────────────────────────────────────────────────
+class TextCache(SurfaceCache):
+    """Rendered text surfaces keyed by (font, size, text, color, antialias,
+    style). With a style the text is laid out from the font's glyph atlas
+    (games.typeset) with that letter/word spacing instead of font.render.
+    """
+
+    def render(self, font, text, color, antialias=True, style=None):
+        if not isinstance(color, tuple):
+            color = tuple(pygame.Color(color))
+        key  = (font, font.get_height(), text, color, antialias, style)
+        surf = self.get(key)
+        if surf is None:
+            if style is None:
+                surf = font.render(text, antialias, color)
+            else:
+                surf = typeset(font, text, color, style)
+            surf = self.put(key, surf)
+        return surf
+
+
+# ─── FONT CACHE ─────────────────────────────────────────────────────────
+class FontCache:
+    """One pygame Font per (path, pixel size), opened on first use.
+
+    scaled() maps a font from this cache to the same face at another size,
+    so a resize opens each new size once and cached text is re-rendered
+    once per size (TEXT keys on the font object).
+    """
+
+    def __init__(self):
+        self._fonts  = {}       # (path, px) -> Font
+        self._origin = {}       # Font -> (path, px)
+
+    def font(self, path, px):
+        key  = (path, max(MIN_FONT_PX, int(px)))
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = pygame.font.Font(*key)
+            self._origin[font] = key
+        return font
+
+    def scaled(self, font, scale):
+        origin = self._origin.get(font)
+        if origin is None or scale == 1:
+            return font                     # a font we did not open: as is
+        path, px = origin
+        return self.font(path, round(px * scale))
+
+    def clear(self):
+        self._fonts.clear()
+        self._origin.clear()
+
+
+TEXT  = TextCache(MAX_TEXT_BYTES)
+FONTS = FontCache()
+
+def render_text(font, text, color, antialias=True, style=None):
+    return TEXT.render(font, text, color, antialias, style)
@@ -0,0 +1,204 @@
+import time
+from collections import deque
+import pygame
+from games.scheduler import SCHEDULER
+from games.text import render_text
+from games.typeset import COPY, PLAIN, atlas_for
+
+# ─── CONFIG ─────────────────────────────────────────────────────────────
+REPEAT_DELAY_MS = 400     # backspace held this long starts repeating
+REPEAT_MS       = 50
+LATENCY_SAMPLES = 200
+COMPOSE_COLOR   = (90, 90, 90)
+
+# keypress-to-screen times (ms) of every TextInput, for the overlay/bench
+LATENCIES = deque(maxlen=LATENCY_SAMPLES)
+
+
+def latency_stats():
+    if not LATENCIES:
+        return {"keys": 0}
+    ordered = sorted(LATENCIES)
+    return {
+        "keys":   len(ordered),
+        "p50_ms": ordered[len(ordered) // 2],
+        "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        "max_ms": ordered[-1],
+    }
+
+
+# ─── VALIDATORS ─────────────────────────────────────────────────────────
+# validator(text, ch) -> what to append to `text` when `ch` is typed
+def printable(max_len):
+    return lambda text, ch: ch if ch.isprintable() and len(text) < max_len else ""
+
+def letters(max_len, upper=False):
+    def accept(text, ch):
+        if not ch.isalpha() or len(text) >= max_len:
+            return ""
+        return ch.upper() if upper else ch
+    return accept
+
+
+# ─── INCREMENTAL LINE ───────────────────────────────────────────────────
+class _Line:
+    """Typed text kept as glyphs on one growing surface.
+
+    Glyphs come from the font's atlas (games.typeset), spaced per `style`.
+    Appending blits only the new glyphs and deleting clears only the tail,
+    instead of font.render of the whole string on every key.
+    """
+
+    def __init__(self, font, color, style):
+        self.atlas = atlas_for(font)
+        self.color = color
+        self.style = style
+        self.text  = ""
+        self.xs    = [0]               # x where glyph i starts; xs[-1] = pen
+        self.buf   = None
+        self.surf  = None
+
+    def set(self, text):
+        if text == self.text and self.surf is not None:
+            return self.surf
+        keep = 0
+        for a, b in zip(self.text, text):
+            if a != b:
+                break
+            keep += 1
+        del self.xs[keep + 1:]
+        x     = self.xs[-1]
+        atlas = self.atlas
+        added = text[keep:]
+        atlas.add(added)
+        sheet = atlas.tinted(self.color)
+        self._reserve(x + sum(atlas.advance(ch, self.style) for ch in added))
+        self.buf.fill((0, 0, 0, 0), pygame.Rect(x, 0, self.buf.get_width() - x, self.buf.get_height()))
+        for ch in added:
+            self.buf.blit(sheet, (x, 0), atlas.rects[ch], COPY)
+            x += atlas.advance(ch, self.style)
+            self.xs.append(x)
+        self.text = text
+        width = x - round(self.style.letter * atlas.em) if text else 0
+        self.surf = self.buf.subsurface((0, 0, max(1, width), self.buf.get_height()))
+        return self.surf
+
+    def _reserve(self, width):
+        if self.buf is not None and self.buf.get_width() >= width:
+            return
+        old = self.buf
+        self.buf = pygame.Surface((max(64, width * 2), self.atlas.height), pygame.SRCALPHA)
+        if old is not None:
+            self.buf.blit(old, (0, 0))
+
+
+# ─── TEXT INPUT ─────────────────────────────────────────────────────────
+class TextInput:
+    """One line of text entry shared by the name prompt and the games.
+
+    Characters come from TEXTINPUT (so IME and dead keys work) and the
+    in-progress IME composition from TEXTEDITING; KEYDOWN is only used for
+    backspace, which repeats while held. Each change is timed from the
+    event being handled to the frame that shows it (see LATENCIES).
+    """
+
+    def __init__(self, validator=printable(64)):
+        self.validator  = validator
+        self.text       = ""
+        self.composing  = ""
+        self._lines     = {}          # (font, color, style) -> _Line
+        self._composed  = (None, None)  # (inputs, surface) while composing
+        self._changed   = None        # perf_counter() of the first unshown change
+        self._held_next = None        # ticks() of the next backspace repeat
+
+    def clear(self):
+        self.text, self.composing = "", ""
+        self._held_next = None
+
+    def focus(self, rect=None):
+        pygame.key.start_text_input()
+        if rect is not None:
+            pygame.key.set_text_input_rect(rect)
+
+    def blur(self):
+        # text input stays on in SDL: KEYDOWN.unicode, which menus read, needs it
+        self.composing  = ""
+        self._held_next = None
+
+    def handle(self, e):
+        # True if the event was text editing we consumed
+        if e.type == pygame.TEXTINPUT:
+            for ch in e.text:
+                self._accept(ch)
+            self.composing = ""
+            return True
+        if e.type == pygame.TEXTEDITING:
+            self.composing = e.text
+            self._touch()
+            return True
+        if e.type == pygame.KEYDOWN and e.key == pygame.K_BACKSPACE:
+            self.backspace()
+            self._held_next = SCHEDULER.ticks() + REPEAT_DELAY_MS
+            SCHEDULER.animate(REPEAT_DELAY_MS + REPEAT_MS)
+            return True
+        if e.type == pygame.KEYUP and e.key == pygame.K_BACKSPACE:
+            self._held_next = None
+            return True
+        return False
+
+    def _accept(self, ch):
+        add = self.validator(self.text, ch)
+        if add:
+            self.text += add
+            self._touch()
+
+    def backspace(self):
+        if self.text:
+            self.text = self.text[:-1]
+            self._touch()
+
+    def update(self):
+        # backspace repeat; call once per frame
+        if self._held_next is None:
+            return
+        if not pygame.key.get_pressed()[pygame.K_BACKSPACE]:
+            self._held_next = None           # released while we were not looking
+            return
+        now = SCHEDULER.ticks()
+        if now >= self._held_next:
+            self.backspace()
+            self._held_next = now + REPEAT_MS
+        SCHEDULER.animate(REPEAT_MS * 2)
+
+    def _touch(self):
+        if self._changed is None:
+            self._changed = time.perf_counter()
+
+    def surface(self, font, color, style=PLAIN):
+        line = self._lines.get((font, color, style))
+        if line is None:
+            line = self._lines[(font, color, style)] = _Line(font, color, style)
+        surf = line.set(self.text)
+        if not self.composing:
+            return surf
+        inputs = (surf, self.composing)
+        if self._composed[0] == inputs:
+            return self._composed[1]
+        extra = render_text(font, self.composing, COMPOSE_COLOR, style=style)
+        both  = pygame.Surface((surf.get_width() + extra.get_width(), font.get_height()), pygame.SRCALPHA)
+        both.blit(surf, (0, 0))
+        both.blit(extra, (surf.get_width(), 0))
+        pygame.draw.line(both, COMPOSE_COLOR, (surf.get_width(), both.get_height() - 2),
+                         (both.get_width(), both.get_height() - 2))
+        self._composed = (inputs, both)
+        return both
+
+    def draw(self, canvas, key, font, color, style=PLAIN, **anchor):
+        rect = canvas.blit(key, self.surface(font, color, style), **anchor)
+        if self._changed is not None:
+            canvas.after_present(self._shown)
+        return rect
+
+    def _shown(self):
+        LATENCIES.append((time.perf_counter() - self._changed) * 1000)
+        self._changed = None
@@ -0,0 +1,80 @@
+import heapq
+import itertools
+from games.scheduler import SCHEDULER
+
+
+# ─── EASING ─────────────────────────────────────────────────────────────
+def ease_in(t):
+    return t * t
+
+
+# ─── TWEEN ──────────────────────────────────────────────────────────────
+class Tween:
+    """A value going from `start` to `end` over `ms`; read it when drawing."""
+
+    def __init__(self, began, ms, start, end, ease):
+        self.began = began
+        self.ms    = ms
+        self.start = start
+        self.end   = end
+        self.ease  = ease
+
+    def done(self, now=None):
+        now = SCHEDULER.ticks() if now is None else now
+        return now >= self.began + self.ms
+
+    def value(self, now=None):
+        now = SCHEDULER.ticks() if now is None else now
+        t = min(1.0, max(0.0, (now - self.began) / self.ms)) if self.ms > 0 else 1.0
+        return self.start + (self.end - self.start) * self.ease(t)
+
+    def finish(self):
+        self.ms = 0
+
+
+# ─── TIMERS ─────────────────────────────────────────────────────────────
+class Timers:
+    """Frame-driven timers and tweens for one scene.
+
+    The engine calls update() once per frame on the top scene, so nothing
+    here sleeps and input keeps flowing. after() asks the frame scheduler
+    to wake the loop when the timer is due; tween() keeps frames coming at
+    the active rate while it runs.
+    """
+
+    def __init__(self):
+        self._heap  = []                  # [due, seq, fn]
+        self._seq   = itertools.count()
+        self.tweens = []
+
+    def after(self, ms, fn):
+        # call fn() after `ms`; returns the timer
+        timer = [SCHEDULER.ticks() + ms, next(self._seq), fn]
+        heapq.heappush(self._heap, timer)
+        SCHEDULER.wake(ms)
+        return timer
+
+    def tween(self, ms, start, end, ease=ease_in):
+        tween = Tween(SCHEDULER.ticks(), ms, start, end, ease)
+        self.tweens.append(tween)
+        SCHEDULER.animate(ms)
+        return tween
+
+    def update(self, now=None):
+        now = SCHEDULER.ticks() if now is None else now
+        while self._heap and self._heap[0][0] <= now:
+            heapq.heappop(self._heap)[2]()
+        if self._heap:
+            SCHEDULER.wake(self._heap[0][0] - now)     # the scheduler tracks one wake
+        if self.tweens:
+            self.tweens = [t for t in self.tweens if not t.done(now)]
+
+    def finish(self):
+        # fast-forward: fire every pending timer now, in due order, and end
+        # the tweens; timers those callbacks add are left to run normally
+        due, self._heap = sorted(self._heap), []
+        for tween in self.tweens:
+            tween.finish()
+        self.tweens = []
+        for _, _, fn in due:
+            fn()
@@ -0,0 +1,126 @@
+from collections import namedtuple
+import pygame
+
+# ─── CONFIG ─────────────────────────────────────────────────────────────
+PRESET     = "".join(chr(c) for c in range(32, 127))   # rasterised up front
+SHEET_W    = 1024
+WHITE      = (255, 255, 255)
+COPY       = pygame.BLEND_RGBA_MAX      # glyph onto transparent pixels
+
+# spacing in ems (the width of "M"); line height as a multiple of linesize
+TextStyle = namedtuple("TextStyle", "letter word line")
+PLAIN     = TextStyle(0.0, 0.0, 1.0)
+# dyslexia guidance: looser tracking and word gaps, taller lines
+READING   = TextStyle(letter=0.12, word=0.35, line=1.5)
+
+
+# ─── GLYPH ATLAS ────────────────────────────────────────────────────────
+class GlyphAtlas:
+    """Every glyph of one font rasterised once, in white, on one sheet.
+
+    Characters outside PRESET are added the first time they are seen. A
+    tinted copy of the sheet is kept per colour, so drawing text is one
+    area blit per glyph and never calls font.render.
+    """
+
+    def __init__(self, font):
+        self.font    = font
+        self.height  = font.get_height()
+        self.em      = font.size("M")[0]
+        self.rects   = {}               # char -> Rect on the sheet
+        self.sheet   = pygame.Surface((SHEET_W, self.height), pygame.SRCALPHA)
+        self._x      = 0
+        self._tinted = {}               # color -> tinted sheet
+        self._pens   = {}               # style -> {char: advance}
+        self.add(PRESET)
+
+    def add(self, chars):
+        for ch in chars:
+            if ch in self.rects:
+                continue
+            glyph = self.font.render(ch, True, WHITE)
+            w = glyph.get_width()
+            if self._x + w > SHEET_W:
+                self._grow()
+            rect = pygame.Rect(self._x, self.sheet.get_height() - self.height, w, self.height)
+            self.sheet.blit(glyph, rect)
+            self.rects[ch] = rect
+            self._x += w
+            self._tinted.clear()
+            self._pens.clear()
+
+    def _grow(self):
+        # one more row of glyphs
+        old = self.sheet
+        self.sheet = pygame.Surface((SHEET_W, old.get_height() + self.height), pygame.SRCALPHA)
+        self.sheet.blit(old, (0, 0))
+        self._x = 0
+
+    def tinted(self, color):
+        sheet = self._tinted.get(color)
+        if sheet is None:
+            sheet = self.sheet.copy()
+            sheet.fill((*color[:3], 255), special_flags=pygame.BLEND_RGBA_MULT)
+            self._tinted[color] = sheet
+        return sheet
+
+    def advance(self, ch, style):
+        # pen movement after `ch`, spacing included
+        return self.advances(style)[ch]
+
+    def advances(self, style):
+        pens = self._pens.get(style)
+        if pens is None:
+            letter = style.letter * self.em
+            pens = self._pens[style] = {ch: r.w + round(letter + (style.word * self.em if ch == " " else 0))
+                                        for ch, r in self.rects.items()}
+        return pens
+
+
+_ATLASES = {}
+
+def atlas_for(font):
+    atlas = _ATLASES.get(font)
+    if atlas is None:
+        atlas = _ATLASES[font] = GlyphAtlas(font)
+    return atlas
+
+
+# ─── LAYOUT ─────────────────────────────────────────────────────────────
+def layout(atlas, text, style=PLAIN, width=None):
+    # [(char, x, y)] and the (w, h) they cover; wraps at spaces to `width`
+    atlas.add(text.replace("\n", ""))
+    pens   = atlas.advances(style)
+    line_h = round(atlas.font.get_linesize() * style.line)
+    placed, lines = [], []
+    for para in text.split("\n"):
+        line, x = [], 0
+        for word in para.split(" "):
+            space = pens[" "] if line else 0
+            if width and line and x + space + sum(pens[ch] for ch in word) > width:
+                lines.append((line, x))
+                line, x, space = [], 0, 0
+            x += space
+            for ch in word:
+                line.append((ch, x))
+                x += pens[ch]
+        lines.append((line, x))
+    # the trailing letter spacing is not part of the text's width
+    trim = round(style.letter * atlas.em)
+    w = max((x - trim for line, x in lines if line), default=0)
+    for row, (line, _) in enumerate(lines):
+        placed += [(ch, x, row * line_h) for ch, x in line]
+    h = line_h * (len(lines) - 1) + atlas.height
+    return placed, (max(1, w), h)
+
+def typeset(font, text, color, style=PLAIN, width=None):
+    # `text` drawn from the glyph atlas, spaced per `style`
+    atlas = atlas_for(font)
+    placed, size = layout(atlas, text, style, width)
+    sheet = atlas.tinted(tuple(color))
+    rects = atlas.rects
+    surf  = pygame.Surface(size, pygame.SRCALPHA)
+    # glyph cells do not overlap and start transparent, so MAX is a plain
+    # copy, about twice as fast as alpha blending
+    surf.blits([(sheet, (x, y), rects[ch], COPY) for ch, x, y in placed], doreturn=False)
+    return surf
@@ -1,235 +1,216 @@
+import time
+LAUNCHED = time.perf_counter()          # startup is timed from before the imports
+
+import importlib
+import sys
 import pygame
-import json
-import os
-from games.game_to_letter import run_treasure_hunt
-from games.game_unjumble  import run_unjumble
-from games.add_letters    import run_add_letters
-from games.memory_match   import run_memory_match
+from games.assets         import ASSETS, load_image
+from games.text           import FONTS
+from games.engine         import Engine, Scene
+from games.scenes         import PopupScene
+from games.profiles       import ProfileStore, default_scores
+from games.persistence    import WriteBehind
+from games.attempts       import ATTEMPTS
+from games.content        import CONTENT
+from games.prefetch       import PREFETCH
+from games.profiler       import PROFILER
+from games.textinput      import TextInput, printable
 
 # ─── Config ──────────────────────────────────────────────────────────────
-SCREEN_W, SCREEN_H = 1024, 768
+SCREEN_W, SCREEN_H = 1024, 768         # initial size; the window is resizable
 FONT_PATH        = "assets/OpenDyslexic-Regular.otf"
-PROFILES_FILE    = "profiles.json"
+PROFILES_FILE    = "profiles.json"     # legacy, imported once into the db
+PROFILES_DB      = "profiles.db"
 NAME_IMAGE       = "assets/images/enter_name.png"
+MENU_BG          = "assets/images/main_menu.png"
 
 # only background for map & locked popups
 MAP_BG           = "assets/images/adventure_map.png"
 LOCKED_BG = "assets/images/default_screen.png"
+MAX_NAME  = 12
+SAVE_TIMEOUT = 5                       # s to wait for queued scores on quit
+
+# ─── Lazy game modules ───────────────────────────────────────────────────
+def game_scene(module, name):
+    # the game's Scene class, importing its module on first use
+    return getattr(importlib.import_module(module), name)
+
+def warm_game(size, module, name):
+    # prefetch worker: import a game and queue its images
+    for spec in game_scene(module, name).assets(size):
+        ASSETS.prefetch(*spec)
 
 # ─── Profile I/O ─────────────────────────────────────────────────────────
-def load_profiles():
-    if not os.path.exists(PROFILES_FILE):
-        return {}
-    with open(PROFILES_FILE, "r") as f:
-        return json.load(f)
-
-def save_profiles(profiles):
-    with open(PROFILES_FILE, "w") as f:
-        json.dump(profiles, f, indent=4)
-
-def create_or_load_profile(username):
-    default_scores = {
-        "treasure":    0.0,
-        "unjumble":    0.0,
-        "add_letters": 0.0,
-        "memory":      0.0
-    }
+def create_or_load_profile(store, writer, username):
     if username == "Guest":
-        return {"scores": default_scores.copy()}, None
-
-    profiles = load_profiles()
-    if username not in profiles:
-        profiles[username] = {"scores": default_scores.copy()}
-    else:
-        if "scores" not in profiles[username]:
-            profiles[username]["scores"] = default_scores.copy()
-    save_profiles(profiles)
-    return profiles[username], profiles
+        return {"scores": default_scores()}, None
+    return store.get_or_create(username), writer
 
 # ─── Start Screen ────────────────────────────────────────────────────────
-def start_screen(screen, font):
-    bg = pygame.image.load("assets/images/main_menu.png")
-    bg = pygame.transform.scale(bg, (SCREEN_W, SCREEN_H))
-    while True:
-        for e in pygame.event.get():
-            if e.type == pygame.QUIT:
-                return None
-            if e.type == pygame.KEYDOWN:
-                if e.key == pygame.K_1: return "start"
-                if e.key == pygame.K_2: return "guest"
-        screen.blit(bg, (0, 0))
-        pygame.display.flip()
+class StartScene(Scene):
+    @classmethod
+    def assets(cls, size):
+        return [(MENU_BG, size, False)]
+
+    def background(self):
+        return load_image(MENU_BG, self.size)
+
+    def enter(self):
+        # warm the next screens, the first game and the word lists while
+        # the menu is up
+        self.engine.preload(UsernameScene)
+        self.engine.preload(MapScene)
+        first = GAMES[pygame.K_1][2]
+        PREFETCH.submit(("game", first), warm_game, self.size, *first)
+        PREFETCH.submit(("content",), CONTENT.load)
+
+    def handle(self, e):
+        if e.type == pygame.KEYDOWN:
+            if e.key == pygame.K_1: self.engine.pop("start")
+            elif e.key == pygame.K_2: self.engine.pop("guest")
 
 # ─── Username Prompt ─────────────────────────────────────────────────────
-def username_prompt(screen, font):
-    bg = pygame.image.load(NAME_IMAGE)
-    bg = pygame.transform.scale(bg, (SCREEN_W, SCREEN_H))
-    box = pygame.Rect(int(SCREEN_W*0.58), int(SCREEN_H*0.4), 300, 60)
-    color, active, username = pygame.Color('black'), False, ""
-    clock = pygame.time.Clock()
-
-    while True:
-        for e in pygame.event.get():
-            if e.type == pygame.QUIT:
-                return None
-            if e.type == pygame.MOUSEBUTTONDOWN:
-                active = box.collidepoint(e.pos)
-            if e.type == pygame.KEYDOWN and active:
-                if e.key == pygame.K_RETURN:
-                    return username.strip() or "Player"
-                if e.key == pygame.K_BACKSPACE:
-                    username = username[:-1]
-                elif e.unicode.isprintable() and len(username)<12:
-                    username += e.unicode
-
-        screen.blit(bg, (0,0))
-        txt = font.render(username, True, (0,0,0))
-        box.w = max(300, txt.get_width()+20)
-        screen.blit(txt, (box.x+10, box.y+15))
-        pygame.draw.rect(screen, color, box, 3)
-        pygame.display.flip()
-        clock.tick(30)
-
-# ─── Welcome Popup ───────────────────────────────────────────────────────
-def popup_message(screen, font, lines):
-    bg     = pygame.image.load("assets/images/default_screen.png")
-    bg     = pygame.transform.scale(bg, (SCREEN_W, SCREEN_H))
-    texts  = [font.render(l, True, (0,0,0)) for l in lines]
-    prompt = font.render("Press SPACE to continue", True, (80,80,80))
-    clock  = pygame.time.Clock()
-
-    while True:
-        for e in pygame.event.get():
-            if e.type == pygame.QUIT:
-                return False
-            if e.type == pygame.KEYDOWN and e.key == pygame.K_SPACE:
-                return True
-
-        screen.blit(bg, (0,0))
-        # center all texts
-        total_h = sum(t.get_height() for t in texts) + 20*(len(texts)-1)
-        y = SCREEN_H//2 - total_h//2
-        for t in texts:
-            r = t.get_rect(center=(SCREEN_W//2, y + t.get_height()//2))
-            screen.blit(t, r)
-            y += t.get_height() + 20
-        screen.blit(prompt, prompt.get_rect(center=(SCREEN_W//2, SCREEN_H*0.85)))
-        pygame.display.flip()
-        clock.tick(30)
-
-# ─── Locked Level Popup ───────────────────────────────────────────────────
-def show_locked(screen, font):
-    bg      = pygame.image.load(LOCKED_BG)
-    bg      = pygame.transform.scale(bg, (SCREEN_W, SCREEN_H))
-    overlay = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-    overlay.fill((0,0,0,180))
-    text   = font.render("You are not at this level yet", True, (255,0,0))
-    prompt = font.render("Press SPACE to return", True, (200,200,200))
-    clock  = pygame.time.Clock()
-
-    while True:
-        for e in pygame.event.get():
-            if e.type == pygame.QUIT: return
-            if e.type == pygame.KEYDOWN and e.key == pygame.K_SPACE:
-                return
-
-        screen.blit(bg, (0,0))
-        screen.blit(overlay, (0,0))
-        screen.blit(text, text.get_rect(center=(SCREEN_W//2, SCREEN_H//2 - 20)))
-        screen.blit(prompt, prompt.get_rect(center=(SCREEN_W//2, SCREEN_H*0.85)))
-        pygame.display.flip()
-        clock.tick(30)
+class UsernameScene(Scene):
+    @classmethod
+    def assets(cls, size):
+        return [(NAME_IMAGE, size, False)]
+
+    def __init__(self, font):
+        super().__init__()
+        self.font = font
+        self.box  = pygame.Rect(0, 0, 0, 0)     # placed by draw() for this size
+        self.name = TextInput(printable(MAX_NAME))
+        self.color, self.active = pygame.Color('black'), False
+
+    def background(self):
+        return load_image(NAME_IMAGE, self.size)
+
+    @property
+    def username(self):
+        return self.name.text
+
+    def handle(self, e):
+        if e.type == pygame.MOUSEBUTTONDOWN:
+            self.active = self.box.collidepoint(e.pos)
+            if self.active: self.name.focus(self.box)
+            else: self.name.blur()
+        if not self.active:
+            return
+        if e.type == pygame.KEYDOWN and e.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
+            self.engine.pop(self.username.strip() or "Player")
+        else:
+            self.name.handle(e)
+
+    def update(self):
+        self.name.update()
+
+    def draw(self, canvas):
+        ui  = self.layout
+        font = ui.font(self.font)
+        box = self.box
+        box.topleft = ui.at(0.58, 0.4)
+        box.size    = ui.size(300, 60)
+        box.w = max(box.w, self.name.surface(font, (0,0,0)).get_width() + ui.px(20))
+        self.name.draw(canvas, "name", font, (0,0,0), topleft=(box.x + ui.px(10), box.y + ui.px(15)))
+        canvas.rect("box", self.color, box, 3)
 
 # ─── Adventure Map ───────────────────────────────────────────────────────
-def adventure_map(screen, font, username, profile, profiles):
-    bg    = pygame.image.load(MAP_BG)
-    bg    = pygame.transform.scale(bg, (SCREEN_W, SCREEN_H))
-    BLUE  = (0,102,204)
-    clock = pygame.time.Clock()
-
-    while True:
-        for e in pygame.event.get():
-            if e.type == pygame.QUIT or (e.type == pygame.KEYDOWN and e.key == pygame.K_ESCAPE):
-                return
-
-            if e.type == pygame.KEYDOWN:
-                # Treasure Hunt
-                if e.key == pygame.K_1:
-                    acc = run_treasure_hunt(screen, font)
-                    profile["scores"]["treasure"] = acc
-                    if profiles: save_profiles(profiles)
-
-                # Unjumble (needs ≥80%)
-                elif e.key == pygame.K_2:
-                    if (profile["scores"].get("treasure") or 0.0) >= 0.8:
-                        acc = run_unjumble(screen, font)
-                        profile["scores"]["unjumble"] = acc
-                        if profiles: save_profiles(profiles)
-                    else:
-                        show_locked(screen, font)
-
-                # Add Letters (needs ≥80%)
-                elif e.key == pygame.K_3:
-                    if (profile["scores"].get("unjumble") or 0.0) >= 0.8:
-                        acc = run_add_letters(screen, font)
-                        profile["scores"]["add_letters"] = acc
-                        if profiles: save_profiles(profiles)
-                    else:
-                        show_locked(screen, font)
-
-                # Memory Match (needs ≥80%)
-                elif e.key == pygame.K_4:
-
-                    if (profile["scores"].get("add_letters") or 0.0) >= 0.8:
-                        font = pygame.font.Font(FONT_PATH, 20)
-                        acc = run_memory_match(screen, font)
-                        profile["scores"]["memory"] = acc
-                        if profiles: save_profiles(profiles)
-                    else:
-                        show_locked(screen, font)
-
-        # draw map on top of bg
-        screen.blit(bg, (0,0))
-
-
-        pygame.display.flip()
-        clock.tick(30)
+# map key -> (score slot, slot that must be ≥80% first, (module, scene))
+GAMES = {
+    pygame.K_1: ("treasure",    None,          ("games.game_to_letter", "TreasureHuntScene")),
+    pygame.K_2: ("unjumble",    "treasure",    ("games.game_unjumble",  "UnjumbleScene")),
+    pygame.K_3: ("add_letters", "unjumble",    ("games.add_letters",    "AddLettersScene")),
+    pygame.K_4: ("memory",      "add_letters", ("games.memory_match",   "MemoryMatchScene")),
+}
+
+class MapScene(Scene):
+    @classmethod
+    def assets(cls, size):
+        return [(MAP_BG, size, False)]
+
+    def __init__(self, font, username, profile, writer):
+        super().__init__()
+        self.font       = font
+        self.small_font = FONTS.font(FONT_PATH, 20)   # memory-match cards
+        self.username   = username
+        self.profile    = profile
+        self.writer     = writer
+
+    def background(self):
+        return load_image(MAP_BG, self.size)
+
+    def enter(self):
+        first = GAMES[pygame.K_1][2]
+        PREFETCH.submit(("game", first), warm_game, self.size, *first)
+
+    def handle(self, e):
+        if e.type != pygame.KEYDOWN:
+            return
+        if e.key == pygame.K_ESCAPE:
+            self.engine.pop()
+        elif e.key in GAMES:
+            slot, needs, game = GAMES[e.key]
+            if needs is None or (self.profile["scores"].get(needs) or 0.0) >= 0.8:
+                font = self.small_font if slot == "memory" else self.font
+                scene = game_scene(*game)
+                self.engine.push(scene(font), then=lambda acc: self.record(slot, acc))
+            else:
+                self.engine.push(PopupScene(self.font, ["You are not at this level yet"],
+                                            color=(255,0,0), prompt="Press SPACE to return"))
+
+    def record(self, slot, acc):
+        self.profile["scores"][slot] = acc
+        # queued; the write-behind thread does the disk I/O
+        if self.writer: self.writer.set_score(self.username, slot, acc)
 
 # ─── Main ────────────────────────────────────────────────────────────────
-def main():
-    pygame.init()
-    screen = pygame.display.set_mode((SCREEN_W, SCREEN_H))
+def main(db=PROFILES_DB, legacy=PROFILES_FILE):
+    PROFILER.begin_startup(LAUNCHED)
+    PROFILER.mark("imports")
+    # only what the menu needs; the mixer starts with memory match
+    pygame.display.init()
+    pygame.font.init()
+    PROFILER.mark("init")
+    screen = pygame.display.set_mode((SCREEN_W, SCREEN_H), pygame.RESIZABLE)
     pygame.display.set_caption("Lucky Letters")
-    font = pygame.font.Font(FONT_PATH, 36)
-
-    # 1) startup
-    from_start = start_screen(screen, font)
-    if from_start is None:
-        pygame.quit()
-        return
-
-    # 2) name or guest
-    if from_start == "start":
-        username = username_prompt(screen, font)
+    font   = FONTS.font(FONT_PATH, 36)
+    PROFILER.mark("window")
+    store  = ProfileStore(db, legacy)
+    writer = WriteBehind(store)
+    PROFILER.mark("profiles")
+    engine = Engine(screen)
+    engine.on_quit(ATTEMPTS.flush)
+
+    # 1) startup -> 2) name or guest
+    def started(choice):
+        if choice == "start":
+            engine.push(UsernameScene(font), then=named)
+        elif choice == "guest":
+            named("Guest")
+
+    # 3) load/create profile -> 4) welcome popup
+    def named(username):
         if username is None:
-            pygame.quit()
             return
-    else:
-        username = "Guest"
-
-    # 3) load/create profile
-    profile, profiles = create_or_load_profile(username)
-
-    # 4) welcome popup
-    lines = (["Welcome, Guest!", "Ready to explore?"]
-             if username=="Guest"
-             else [f"Welcome, {username}!", "Let's begin your adventure!"])
-    if not popup_message(screen, font, lines):
-        pygame.quit()
-        return
-
-    # 5) adventure map
-    adventure_map(screen, font, username, profile, profiles)
+        profile, profile_writer = create_or_load_profile(store, writer, username)
+        ATTEMPTS.set_student(None if username == "Guest" else username)
+        lines = (["Welcome, Guest!", "Ready to explore?"]
+                 if username=="Guest"
+                 else [f"Welcome, {username}!", "Let's begin your adventure!"])
+        welcome = PopupScene(font, lines, color=(0,0,0), prompt_color=(80,80,80),
+                             dim=0, image=LOCKED_BG)
+
+        # 5) adventure map
+        def welcomed(ok):
+            if ok:
+                engine.push(MapScene(font, username, profile, profile_writer))
+        engine.push(welcome, then=welcomed)
+
+    engine.run(StartScene(), then=started)
+    if not writer.close(timeout=SAVE_TIMEOUT):
+        print(f"could not save {writer.unsaved()} score(s): {writer.errors} failed write(s)",
+              file=sys.stderr)
+    store.close()
     pygame.quit()
 
 if __name__ == "__main__":
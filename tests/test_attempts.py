@@ -0,0 +1,13 @@
+from games.attempts import AttemptLog, TEXT_BYTES
+
+
+def test_long_words_are_cut_between_characters(tmp_path):
+    log = AttemptLog(str(tmp_path))
+    log.set_student("ana")
+    word = "é" * TEXT_BYTES                  # two bytes each
+    log.record("unjumble", "K", word, word, "x" + word, False, 900.0)
+    log.flush()
+    [a] = log.scan("ana")
+    assert a.word == a.expected == "é" * (TEXT_BYTES // 2)
+    assert a.response == "x" + "é" * (TEXT_BYTES // 2 - 1)
+    assert "�" not in a.word + a.response
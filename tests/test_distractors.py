@@ -0,0 +1,26 @@
+import pytest
+from games.distractors import DistractorIndex, ranked
+
+BANK = DistractorIndex(["EARLY", "LOUD", "KNOW", "CHILD", "LOG", "DOG"])
+
+
+@pytest.mark.parametrize("word, start, length, expected", [
+    ("EARLY", 1, 2, ("ER", "UR")),       # same sound before reversal or looks
+    ("LOUD",  1, 2, ("OW", "OO")),
+    ("KNOW",  1, 2, ("ON", "NA")),       # no sound group: reversal first
+    ("CHILD", 1, 1, ("N", "K")),         # no unrelated filler while confusables last
+])
+def test_options_are_real_confusables(word, start, length, expected):
+    assert BANK.options(word, start, length) == expected
+
+
+def test_options_never_spell_another_bank_word():
+    # LOG -> DOG is a word, so D is skipped even though it mirrors B
+    assert "D" not in BANK.options("LOG", 0, 1, n=30)
+    assert "L" not in BANK.options("DOG", 0, 1, n=30)
+
+
+def test_ranking_is_deterministic_and_excludes_the_answer():
+    assert ranked("ar") == ranked("AR")
+    assert "AR" not in ranked("AR")
+    assert len(set(ranked("AR"))) == len(ranked("AR"))
@@ -0,0 +1,59 @@
+import threading
+import time
+from games import persistence
+from games.persistence import WriteBehind
+
+
+class FlakyStore:
+    # fails the first `failures` batches, then keeps what it is given
+    def __init__(self, failures=0, gate=None):
+        self.failures = failures
+        self.gate     = gate
+        self.batches  = []
+
+    def write_batch(self, batch):
+        if self.gate is not None:
+            self.gate.wait()
+        if self.failures:
+            self.failures -= 1
+            raise OSError("share offline")
+        self.batches.append(batch)
+
+    def close(self):
+        pass
+
+
+def test_failed_batches_are_retried_and_coalesced(monkeypatch):
+    monkeypatch.setattr(persistence, "RETRY_MS", 10)
+    store  = FlakyStore(failures=2)
+    writer = WriteBehind(store, coalesce_ms=1)
+    writer.set_score("meg", "treasure", 0.5)
+    assert writer.flush(timeout=5)
+    writer.set_score("meg", "treasure", 0.75)
+    assert writer.close(timeout=5)
+    assert writer.errors == 2
+    assert store.batches == [{"meg": {"treasure": 0.5}}, {"meg": {"treasure": 0.75}}]
+
+
+def test_close_gives_up_on_a_store_that_keeps_failing():
+    writer = WriteBehind(FlakyStore(failures=10**6), coalesce_ms=1)
+    writer.set_score("meg", "treasure", 0.5)
+    writer.set_score("sam", "memory", 1.0)
+    started = time.monotonic()
+    assert not writer.close(timeout=0.3)
+    assert time.monotonic() - started < 1.5
+    assert writer.unsaved() == 2
+
+
+def test_unsaved_counts_the_batch_being_written():
+    gate   = threading.Event()
+    writer = WriteBehind(FlakyStore(gate=gate), coalesce_ms=1)
+    writer.set_score("meg", "treasure", 0.5)
+    deadline = time.monotonic() + 2
+    while writer._pending and time.monotonic() < deadline:
+        time.sleep(0.001)                  # wait for the worker to take it
+    assert not writer.flush(timeout=0.05)
+    assert writer.unsaved() == 1
+    gate.set()
+    assert writer.close(timeout=5)
+    assert writer.unsaved() == 0
@@ -0,0 +1,29 @@
+import json
+from games.profiles import ProfileStore, default_scores, normalize
+
+
+def test_normalize_fills_missing_scores_and_folds_case_duplicates():
+    profiles = normalize({
+        "meg": {"scores": {"treasure": 0.5, "unjumble": None}, "levels_completed": [1]},
+        "Meg ": {"scores": {"treasure": 0.25, "memory": 1}, "levels_completed": [1, 2]},
+        "sam": None,
+    })
+    assert set(profiles) == {"meg", "sam"}
+    assert profiles["meg"]["scores"] == {**default_scores(), "treasure": 0.5, "memory": 1.0}
+    assert profiles["meg"]["levels_completed"] == [1, 2]
+    assert profiles["sam"]["scores"] == default_scores()
+
+
+def test_migrate_imports_the_legacy_file_once(tmp_path):
+    legacy = tmp_path / "profiles.json"
+    legacy.write_text(json.dumps({"Meg": {"scores": {"unjumble": 0.8}}, "meg": {"scores": {"unjumble": 0.9}}}))
+    store = ProfileStore(str(tmp_path / "profiles.db"), str(legacy))
+    assert store.get("MEG")["scores"]["unjumble"] == 0.9
+    store.set_score("meg", "unjumble", 0.1)
+    store.close()
+
+    # a second open must not re-import over newer scores
+    store = ProfileStore(str(tmp_path / "profiles.db"), str(legacy))
+    assert list(store.all()) == ["Meg"]
+    assert store.get("meg")["scores"]["unjumble"] == 0.1
+    store.close()
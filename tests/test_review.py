@@ -0,0 +1,67 @@
+import time
+from collections import namedtuple
+from games.review import ReviewScheduler
+
+Attempt = namedtuple("Attempt", "game level word correct ts")
+WORDS   = ["jam", "bed", "mud", "sun", "bag", "hat", "pig", "fox", "cup", "net"]
+
+
+class FakeLog:
+    # the parts of ATTEMPTS the scheduler uses, kept in memory
+    def __init__(self, student="ana"):
+        self.student   = student
+        self.attempts  = []
+        self.callbacks = []
+
+    def on_record(self, cb):
+        self.callbacks.append(cb)
+
+    def record(self, game, level, word, correct):
+        ts = time.time()
+        self.attempts.append(Attempt(game, "K-1", word, correct, ts))
+        for cb in self.callbacks:
+            cb(self.student, game, level, word, correct, ts)
+
+    def flush(self):
+        pass
+
+    def scan(self, student):
+        return list(self.attempts)
+
+
+def select(review, n=5):
+    return review.select("unjumble", "K", WORDS, n=n, key=lambda w: w)
+
+
+def test_miss_comes_back_first_in_the_same_process():
+    log = FakeLog()
+    review = ReviewScheduler(log)
+    first = select(review)
+    for word in first:
+        log.record("unjumble", "K", word, word != first[0])
+    # the miss outranks the five words never tried
+    assert select(review, n=1) == [first[0]]
+    assert first[0] in select(review)
+
+
+def test_miss_order_matches_a_replay_after_restart():
+    log = FakeLog()
+    review = ReviewScheduler(log)
+    first = select(review)
+    for word in first:
+        log.record("unjumble", "K", word, word != first[0])
+    live     = select(review, n=1)
+    replayed = select(ReviewScheduler(log), n=1)
+    assert live == replayed == [first[0]]
+
+
+def test_long_word_matches_its_logged_history(tmp_path):
+    from games.attempts import AttemptLog
+    log = AttemptLog(str(tmp_path))
+    log.set_student("ana")
+    words = ["kindergartenvocabulary", "caterpillars-and-butterflies"] + WORDS
+    log.record("unjumble", "K", words[0], words[0], "", False, 900.0)
+    log.flush()
+    # a new process: history comes from the log, which keeps 16 bytes
+    review = ReviewScheduler(log)
+    assert review.select("unjumble", "K", words, n=1, key=lambda w: w) == [words[0]]
@@ -0,0 +1,28 @@
+import random
+from games.scrambles import POOL_SIZE, WINDOW, pick, pool, swaps_to_solve
+
+
+def test_pool_is_deterministic_sorted_and_never_the_word():
+    scrambles = pool("garden")
+    assert scrambles == pool.__wrapped__("garden")
+    assert 0 < len(scrambles) <= POOL_SIZE
+    assert all(s.text != "garden" and sorted(s.text) == sorted("garden") for s in scrambles)
+    assert [s.difficulty for s in scrambles] == sorted(s.difficulty for s in scrambles)
+
+
+def test_short_and_single_letter_words():
+    assert [s.text for s in pool("ab")] == ["ba"]
+    assert [s.text for s in pool("aaa")] == ["aaa"]       # cannot be scrambled
+
+
+def test_swaps_match_repeated_letters_in_order():
+    assert swaps_to_solve("ba", "ab") == 1
+    assert swaps_to_solve("banana", "banana") == 0
+    assert swaps_to_solve("abnana", "banana") == 1
+
+
+def test_pick_stays_near_the_target_difficulty():
+    scrambles = pool("yellow")
+    rng = random.Random(1)
+    for target, nearest in ((0.0, scrambles[:WINDOW]), (1.0, scrambles[-WINDOW:])):
+        assert pick("yellow", target, rng) in nearest